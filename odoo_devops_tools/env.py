@@ -9,22 +9,34 @@ from __future__ import annotations
 
 import argparse
 import configparser
+import functools
+import hashlib
 import io
 import logging
 import os
 import re
+import shlex
 import shutil
 import stat
 import subprocess
 import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
 from . import __version__
 
 _logger = logging.getLogger("odt-env")
 
+# Evaluated once; checked on several paths per sync.
+IS_WINDOWS = sys.platform.startswith("win")
+
+# Venv-relative path of the interpreter, shared by every venv-python lookup.
+_VENV_PY_SUFFIX = "Scripts/python.exe" if IS_WINDOWS else "bin/python"
+
 _DEFAULT_REQUIREMENTS = [
     "pip",
     "setuptools",
@@ -60,6 +72,7 @@ class OdooSpec:
     branch: str
     commit: Optional[str] = None
     shallow: bool = True
+    partial: bool = False
 
 
 @dataclass(frozen=True)
@@ -69,6 +82,7 @@ class AddonSpec:
     commit: Optional[str] = None
     path: Optional[str] = None
     shallow: bool = True
+    partial: bool = False
 
     @property
     def is_local(self) -> bool:
@@ -134,20 +148,67 @@ class Layout:
 # Helpers: validation & parsing
 # -----------------------------
 
-def _handle_process_output(p, err_msg: str):
-    if p.stdout:
-        _logger.info(p.stdout)
-    if p.stderr:
-        _logger.warning(p.stderr)
+# Defaults for every pip/uv subprocess: no "new pip version" network check at
+# startup, and fail fast instead of prompting on a TTY.
+_PIP_SUBPROCESS_ENV = {
+    "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+    "PIP_NO_INPUT": "1",
+}
+
+
+def _run_streaming(cmd: list[str], cwd: Optional[Path], err_msg: str) -> None:
+    """Run a command, streaming combined stdout/stderr to the log line by line.
+
+    Unlike capture_output=True this keeps memory bounded for chatty commands
+    (uv pip compile / pip wheel can emit MBs of output) and surfaces progress
+    immediately. Only a tail of the output is retained for error reporting.
+    """
+    tail: deque[str] = deque(maxlen=200)
+    with subprocess.Popen(
+            cmd,
+            cwd=str(cwd) if cwd else None,
+            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            env={**os.environ, **_PIP_SUBPROCESS_ENV},
+    ) as p:
+        for line in p.stdout or []:
+            line = line.rstrip()
+            _logger.info(line)
+            tail.append(line)
+
     if p.returncode != 0:
-        raise Exception(err_msg)
+        raise Exception(err_msg + "\n" + "\n".join(tail))
+
+
+@functools.lru_cache(maxsize=None)
+def _uv_path() -> Optional[str]:
+    """Locate the uv executable once per process (PATH scans stat many directories)."""
+    return shutil.which("uv")
 
 
 def _rmtree(path: Path) -> None:
-    """Remove a directory tree (best-effort handling for read-only files on Windows)."""
+    """Remove a directory tree.
+
+    Bulk deletes (venv, wheelhouse) go through the platform's native tool
+    first: `rm -rf` / `rd /s /q` walk large trees far faster than Python's
+    per-entry shutil.rmtree. Any failure falls back to shutil.rmtree with
+    best-effort handling for read-only files on Windows.
+    """
     if not path.exists():
         return
 
+    if IS_WINDOWS:
+        cmd = ["cmd", "/c", "rd", "/s", "/q", str(path)]
+    else:
+        cmd = ["rm", "-rf", str(path)]
+    try:
+        if subprocess.run(cmd, close_fds=False).returncode == 0 and not path.exists():
+            return
+    except FileNotFoundError:
+        pass
+
     def onerror(func, p, exc_info):
         try:
             os.chmod(p, stat.S_IWRITE)
@@ -158,6 +219,32 @@ def _rmtree(path: Path) -> None:
     shutil.rmtree(path, onerror=onerror)
 
 
+def _ensure_dirs(*paths: Path) -> None:
+    """Create every directory once (parents included), deduplicating repeats."""
+    seen: set[str] = set()
+    for p in paths:
+        key = str(p)
+        if key not in seen:
+            seen.add(key)
+            os.makedirs(p, exist_ok=True)
+
+
+def _dir_has_suffix(path: Path, suffix: str) -> Optional[bool]:
+    """Return whether directory `path` holds a regular file ending in `suffix`.
+
+    None means `path` is missing or not a directory. One scandir pass (with
+    short-circuit) replaces the exists()/is_dir()/glob() stat triple.
+    """
+    try:
+        with os.scandir(path) as it:
+            return any(
+                entry.name.endswith(suffix) and entry.is_file(follow_symlinks=False)
+                for entry in it
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
 def _require_table(d: Dict[str, Any], key: str) -> Dict[str, Any]:
     v = d.get(key)
     if not isinstance(v, dict):
@@ -188,27 +275,34 @@ def _require_list_str(d: Dict[str, Any], key: str) -> list[str]:
     return [x.strip() for x in v]
 
 
-def _ini_for_audit_log(cp: configparser.ConfigParser) -> str:
+def _own_options(cp: configparser.ConfigParser) -> Dict[str, list[str]]:
+    """Map each section to the options explicitly defined in it (excludes DEFAULT)."""
+    return {section: list(cp._sections.get(section, {})) for section in cp.sections()}
+
+
+def _ini_for_audit_log(cp: configparser.ConfigParser, own_options: Optional[Dict[str, list[str]]] = None) -> str:
     """
     Return a resolved (interpolated) INI representation suitable for audit logging.
     Comments are not preserved by ConfigParser by design.
     """
-    # Build a resolved copy (so ${vars:...} etc. is expanded in the log).
-    resolved = configparser.ConfigParser(interpolation=None)
+    if own_options is None:
+        own_options = _own_options(cp)
 
-    for section in cp.sections():
-        if not resolved.has_section(section):
-            resolved.add_section(section)
+    # Stream resolved values (so ${vars:...} etc. is expanded in the log)
+    # straight into the buffer instead of materializing a second parser.
+    buf = io.StringIO()
+    for section, options in own_options.items():
+        buf.write(f"[{section}]\n")
 
-        for option in cp._sections.get(section, {}).keys():
+        for option in options:
             value = cp.get(section, option, raw=False)  # resolve interpolation
             opt_l = option.lower()
             if any(k in opt_l for k in _SENSITIVE_KEYS):
                 value = "******"
-            resolved.set(section, option, value)
+            buf.write(f"{option} = {value}\n")
+
+        buf.write("\n")
 
-    buf = io.StringIO()
-    resolved.write(buf)
     return buf.getvalue()
 
 
@@ -248,9 +342,12 @@ def _read_ini(
         vars_overrides: Optional[Dict[str, str]] = None,
 ) -> configparser.ConfigParser:
     cp = configparser.ConfigParser(interpolation=configparser.ExtendedInterpolation())
-    read_ok = cp.read(entry_ini, encoding="utf-8")
-    if not read_ok:
-        raise Exception(f"Failed to read INI config: {entry_ini}")
+    # Read the file from disk exactly once and parse the in-memory text.
+    try:
+        ini_text = entry_ini.read_text(encoding="utf-8")
+    except OSError as e:
+        raise Exception(f"Failed to read INI config: {entry_ini}") from e
+    cp.read_string(ini_text, source=str(entry_ini))
 
     if vars_overrides:
         if not cp.has_section("vars"):
@@ -299,7 +396,12 @@ def load_project_config(
 
     cp = _read_ini(ini_path, vars_overrides=vars_overrides)
 
-    _logger.info("Loaded INI (resolved) from %s:\n%s", ini_path, _ini_for_audit_log(cp))
+    # Enumerate each section's own options once; reused below and by the audit log.
+    own_options = _own_options(cp)
+
+    # Building the audit log is not free; skip it entirely when INFO is discarded.
+    if _logger.isEnabledFor(logging.INFO):
+        _logger.info("Loaded INI (resolved) from %s:\n%s", ini_path, _ini_for_audit_log(cp, own_options))
 
     def _require_option(section: str, option: str) -> str:
         if not cp.has_section(section):
@@ -376,6 +478,7 @@ def load_project_config(
         commit=odoo_commit,
         version=odoo_version,
         shallow=_get_bool("odoo", "shallow", default=True),
+        partial=_get_bool("odoo", "partial_clone", default=False),
     )
 
     # Addons are optional. If there are no [addons.<name>] sections, keep addons empty.
@@ -389,6 +492,7 @@ def load_project_config(
             has_branch = cp.has_option(sec, "branch")
             has_commit = cp.has_option(sec, "commit")
             has_shallow = cp.has_option(sec, "shallow")
+            has_partial = cp.has_option(sec, "partial_clone")
 
             path_value = cp.get(sec, "path", fallback="").strip() if has_path else ""
             if has_path:
@@ -396,11 +500,11 @@ def load_project_config(
                     raise Exception(
                         f"Invalid option 'path' in section [{sec}] (expected non-empty string)."
                     )
-                if has_repo or has_branch or has_commit or has_shallow:
+                if has_repo or has_branch or has_commit or has_shallow or has_partial:
                     raise Exception(
                         f"Invalid addon source in section [{sec}]: "
                         "use either 'path' only for a local addon, or 'repo' + 'branch' "
-                        "(+ optional 'commit' and 'shallow') for a git addon."
+                        "(+ optional 'commit', 'shallow' and 'partial_clone') for a git addon."
                     )
                 addons[name] = AddonSpec(path=path_value)
                 continue
@@ -410,13 +514,14 @@ def load_project_config(
                 branch=_require_option(sec, "branch"),
                 commit=cp.get(sec, "commit", fallback="").strip() or None,
                 shallow=_get_bool(sec, "shallow", default=True),
+                partial=_get_bool(sec, "partial_clone", default=False),
             )
 
     if not cp.has_section("config"):
         raise Exception("Missing INI section: [config]")
     config: Dict[str, Any] = {}
     # Only include keys explicitly defined in [config] (exclude DEFAULT values).
-    for key in cp._sections.get("config", {}).keys():
+    for key in own_options.get("config", []):
         if key == "addons_path":
             raise Exception(
                 "Option 'addons_path' in section [config] is not allowed. "
@@ -439,7 +544,8 @@ def require_venv(
         raise Exception("Missing required uv python version (python_version).")
 
     # Validate that 'uv' exists in PATH before doing anything else.
-    if shutil.which("uv") is None:
+    uv = _uv_path()
+    if uv is None:
         print("ERROR: 'uv' command not found in PATH.", file=sys.stderr)
         raise SystemExit(1)
 
@@ -447,87 +553,83 @@ def require_venv(
         raise Exception(f"venv path exists but is not a directory: {venv_dir}")
 
     if not venv_dir.exists():
+        # Collect the uv bootstrap steps and run them in a single shell
+        # invocation to avoid paying process-launch + uv startup cost per step.
+        steps: list[list[str]] = []
+
         # Install managed python
         if managed_python:
-            is_windows = sys.platform.startswith("win")
-            if is_windows:
+            if IS_WINDOWS:
                 cpy_tag = f"cpython-{python_version}-windows-x86_64-none"
             else:
                 cpy_tag = f"cpython-{python_version}-linux-x86_64-gnu"
-            cmd = ["uv", "python", "install", cpy_tag]
             _logger.info(f"Installing managed python {python_version} (x64) with uv: {cpy_tag}")
-            p = subprocess.run(
-                cmd,
-                cwd=str(layout.root),
-                text=True,
-                capture_output=True,
-            )
-            _handle_process_output(p, err_msg=(
-                f"Failed to install managed python {python_version} (x64) with uv: {cpy_tag}\n"
-                f"Command: {' '.join(p.args if isinstance(p.args, list) else [str(p.args)])}\n"
-                f"{p.stdout}\n{p.stderr}"
-            ))
+            steps.append([uv, "python", "install", cpy_tag])
 
         # Create virtualenv
         _logger.info("Creating virtualenv with uv: %s (python=%s)", venv_dir, python_version)
-        cmd = [
-            "uv", "venv",
+        venv_cmd = [
+            uv, "venv",
             "-p", python_version,
             str(venv_dir),
         ]
         if not managed_python:
-            cmd.extend([
+            venv_cmd.extend([
                 "--no-managed-python",
             ])
-        p = subprocess.run(
-            cmd,
-            cwd=str(layout.root),
-            text=True,
-            capture_output=True,
-        )
-        _handle_process_output(p, err_msg=(
-            f"Failed to create virtualenv at: {venv_dir}\n"
-            f"Command: {' '.join(p.args if isinstance(p.args, list) else [str(p.args)])}\n"
-            f"{p.stdout}\n{p.stderr}"
-        ))
+        steps.append(venv_cmd)
 
-        # Install seed packages into virtualenv
+        # Install seed packages into virtualenv (created by the previous step)
         if not reuse_wheelhouse:
-            venv_py = venv_dir / ("Scripts/python.exe" if sys.platform.startswith("win") else "bin/python")
-            if not venv_py.exists():
-                raise Exception(f"venv python not found at expected path: {venv_py}")
+            venv_py = venv_dir / _VENV_PY_SUFFIX
             seed_packages = [
                 "pip",
                 "setuptools",
                 "wheel",
             ]
             _logger.info("Installing seed packages into venv: %s", venv_dir)
-            cmd = ["uv", "pip", "install", "-p", str(venv_py), *seed_packages]
-            p = subprocess.run(
-                cmd,
-                cwd=str(layout.root),
-                text=True,
-                capture_output=True,
-            )
-            _handle_process_output(p, err_msg=(
-                "Failed to install seed packages into venv.\n"
-                f"Command: {' '.join(p.args if isinstance(p.args, list) else [str(p.args)])}\n"
-                f"{p.stdout}\n{p.stderr}"
-            ))
+            steps.append([uv, "pip", "install", "-p", str(venv_py), *seed_packages])
+
+        if IS_WINDOWS:
+            joined = " && ".join(subprocess.list2cmdline(step) for step in steps)
+            cmd = ["cmd", "/c", joined]
+        else:
+            joined = " && ".join(" ".join(shlex.quote(arg) for arg in step) for step in steps)
+            cmd = ["sh", "-c", joined]
+
+        _run_streaming(cmd, cwd=layout.root, err_msg=(
+            f"Failed to bootstrap virtualenv at: {venv_dir}\n"
+            f"Command: {joined}"
+        ))
+
+        if not reuse_wheelhouse:
+            venv_py = venv_dir / _VENV_PY_SUFFIX
+            if not venv_py.exists():
+                raise Exception(f"venv python not found at expected path: {venv_py}")
 
 
 # -----------------------------
 # Requirements filtering helpers
 # -----------------------------
 
+# Compiled once; these run on every requirements line during lock generation.
+_CANON_RE = re.compile(r"[-_.]+")
+_INLINE_COMMENT_RE = re.compile(r"\s+#")
+_EGG_RE = re.compile(r"[#&]egg=([^&]+)")
+_NAME_RE = re.compile(r"([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+
+# Bounded cache: names come from untrusted requirements files, but the same
+# distributions recur across Odoo + addon requirement sets.
+@functools.lru_cache(maxsize=4096)
 def _canonicalize_project_name(name: str) -> str:
     """Canonicalize a Python distribution name similar to packaging.utils.canonicalize_name."""
-    return re.sub(r"[-_.]+", "-", name.strip().lower())
+    return _CANON_RE.sub("-", name.strip().lower())
 
 
 def _strip_inline_comment(line: str) -> str:
     """Remove trailing comments (a '#' preceded by whitespace)."""
-    m = re.search(r"\s+#", line)
+    m = _INLINE_COMMENT_RE.search(line)
     return line[: m.start()].rstrip() if m else line.rstrip()
 
 
@@ -539,7 +641,7 @@ def _extract_req_name_from_spec(spec: str) -> Optional[str]:
 
     # VCS/URL requirement like: git+...#egg=foo
     if "egg=" in s:
-        m = re.search(r"[#&]egg=([^&]+)", s)
+        m = _EGG_RE.search(s)
         if m:
             return _canonicalize_project_name(m.group(1))
 
@@ -550,7 +652,7 @@ def _extract_req_name_from_spec(spec: str) -> Optional[str]:
             return _canonicalize_project_name(left.strip())
 
     # Standard requirement: name[extra] >= 1.0 ; markers
-    m = re.match(r"([A-Za-z0-9][A-Za-z0-9._-]*)", s)
+    m = _NAME_RE.match(s)
     if m:
         return _canonicalize_project_name(m.group(1))
 
@@ -576,6 +678,12 @@ def _filter_requirements_file(
             out_lines.append(raw)
             continue
 
+        # Fast path: with nothing to ignore we only need to inline nested
+        # -r includes; every other line is copied verbatim without tokenizing.
+        if not ignore_names and not stripped.startswith("-"):
+            out_lines.append(raw)
+            continue
+
         no_comment = _strip_inline_comment(raw)
 
         # Include other requirement files (inline them so ignore works recursively).
@@ -633,7 +741,8 @@ def compile_all_requirements_lock(
 
     Returns the path to the generated lock file.
     """
-    if shutil.which("uv") is None:
+    uv = _uv_path()
+    if uv is None:
         raise Exception("Required command not found in PATH: uv")
 
     ignore_set: set[str] = set()
@@ -649,22 +758,59 @@ def compile_all_requirements_lock(
     wheelhouse_dir.mkdir(parents=True, exist_ok=True)
     in_path = wheelhouse_dir / "all-requirements.in.txt"
 
-    req_lines: list[str] = []
-    for req_path in requirement_files:
+    # Path.resolve() walks the filesystem; do it once per path (and once for
+    # the workspace root) instead of per use below.
+    workspace_resolved = workspace_root.resolve()
+
+    def _read_filtered(req_path: Path) -> Optional[tuple[Path, list[str]]]:
         if not req_path.exists():
             # Skip silently; the caller may include optional files.
+            return None
+        resolved = req_path.resolve()
+        return resolved, _filter_requirements_file(resolved, ignore_set, visited={resolved})
+
+    # The files are independent (each recursion keeps its own `visited` set),
+    # so read + filter them concurrently and join the results in input order.
+    if requirement_files:
+        with ThreadPoolExecutor(max_workers=min(32, len(requirement_files))) as ex:
+            filtered_by_file = list(ex.map(_read_filtered, requirement_files))
+    else:
+        filtered_by_file = []
+
+    # The same package is often listed by several repos (psycopg2, lxml, ...).
+    # Keep the first occurrence per canonical name so the resolver sees one
+    # constraint per project; later duplicates stay visible as comments.
+    seen_names: set[str] = set()
+    for spec in base_requirements or []:
+        name = _extract_req_name_from_spec(spec)
+        if name:
+            seen_names.add(name)
+
+    req_lines: list[str] = []
+    for req_path, result in zip(requirement_files, filtered_by_file):
+        if result is None:
             continue
+        resolved, filtered_lines = result
 
         try:
-            rel = req_path.resolve().relative_to(workspace_root.resolve())
-            rel_label = rel.as_posix()
+            rel_label = resolved.relative_to(workspace_resolved).as_posix()
         except Exception:
             rel_label = str(req_path)
 
         req_lines.append(f"# --- from {rel_label} ---")
-        visited = {req_path.resolve()}
-        filtered_lines = _filter_requirements_file(req_path.resolve(), ignore_set, visited=visited)
-        req_lines.extend(filtered_lines)
+        for raw in filtered_lines:
+            stripped = raw.strip()
+            if not stripped or stripped.startswith(("#", "-")):
+                req_lines.append(raw)
+                continue
+
+            name = _extract_req_name_from_spec(_strip_inline_comment(raw).strip())
+            if name and name in seen_names:
+                req_lines.append(f"# odt-env: skipped duplicate ('{name}' already listed): {raw}")
+                continue
+            if name:
+                seen_names.add(name)
+            req_lines.append(raw)
         req_lines.append("")
 
     lines: list[str] = [
@@ -681,12 +827,18 @@ def compile_all_requirements_lock(
 
     lines.extend(req_lines)
 
-    in_path.write_text("\n".join(lines).rstrip("\n") + "\n", encoding="utf-8")
+    # Trim trailing blank lines, then stream to the file line by line instead
+    # of materializing one giant joined string.
+    while lines and not lines[-1]:
+        lines.pop()
+    with in_path.open("w", encoding="utf-8", newline="\n") as f:
+        f.writelines(f"{line}\n" for line in lines)
 
     _logger.info("Compiling lock file with uv: %s -> %s", in_path, output_lock_path)
     cmd = [
-        "uv", "pip", "compile",
+        uv, "pip", "compile",
         "-p", str(venv_python),
+        "--no-progress",
         str(in_path),
         "-o", str(output_lock_path),
     ]
@@ -696,19 +848,11 @@ def compile_all_requirements_lock(
             '--build-constraints', str(build_constraints_path),
         ])
 
-    p = subprocess.run(
-        cmd,
-        cwd=str(workspace_root),
-        text=True,
-        capture_output=True,
-    )
-
-    _handle_process_output(p, err_msg=(
+    _run_streaming(cmd, cwd=workspace_root, err_msg=(
         "Failed to compile requirements lock file.\n"
-        f"Command: {' '.join(p.args if isinstance(p.args, list) else [str(p.args)])}\n"
+        f"Command: {' '.join(cmd)}\n"
         f"Input: {in_path}\n"
-        f"Output: {output_lock_path}\n"
-        f"{p.stdout}\n{p.stderr}"
+        f"Output: {output_lock_path}"
     ))
 
     return output_lock_path
@@ -726,7 +870,8 @@ def build_wheelhouse_from_requirements(
     if not requirements_path.exists():
         raise Exception(f"Requirements file not found: {requirements_path}")
 
-    if shutil.which("uv") is None:
+    uv = _uv_path()
+    if uv is None:
         raise Exception("Required command not found in PATH: uv")
 
     wheelhouse_dir.mkdir(parents=True, exist_ok=True)
@@ -737,35 +882,21 @@ def build_wheelhouse_from_requirements(
             str(venv_python), "-m", "pip", "cache", "purge",
         ]
         _logger.info("Clearing pip's wheel cache")
-        p = subprocess.run(
-            cmd,
-            cwd=str(workspace_root),
-            text=True,
-            capture_output=True,
-        )
-        _handle_process_output(p, err_msg=(
+        _run_streaming(cmd, cwd=workspace_root, err_msg=(
             "Failed to clear pip's wheel cache.\n"
-            f"Command: {' '.join(p.args if isinstance(p.args, list) else [str(p.args)])}\n"
-            f"{p.stdout}\n{p.stderr}"
+            f"Command: {' '.join(cmd)}"
         ))
 
     # Install build constraints to virtualenv before creating wheelhouse
     if build_constraints_path.is_file():
         _logger.info(f"Installing build constraints to virtualenv: {build_constraints_path}")
         cmd = [
-            "uv", "pip", "install", "-p", str(venv_python),
+            uv, "pip", "install", "-p", str(venv_python),
             "-U", "-r", str(build_constraints_path),
         ]
-        p = subprocess.run(
-            cmd,
-            cwd=str(workspace_root),
-            text=True,
-            capture_output=True,
-        )
-        _handle_process_output(p, err_msg=(
+        _run_streaming(cmd, cwd=workspace_root, err_msg=(
             f"Failed to install build constraints to virtualenv: {build_constraints_path}\n"
-            f"Command: {' '.join(p.args if isinstance(p.args, list) else [str(p.args)])}\n"
-            f"{p.stdout}\n{p.stderr}"
+            f"Command: {' '.join(cmd)}"
         ))
 
     # Create wheelhouse
@@ -776,16 +907,9 @@ def build_wheelhouse_from_requirements(
         "--no-deps",
     ]
     _logger.info("Creating wheelhouse: %s -> %s", requirements_path, wheelhouse_dir)
-    p = subprocess.run(
-        cmd,
-        cwd=str(workspace_root),
-        text=True,
-        capture_output=True,
-    )
-    _handle_process_output(p, err_msg=(
+    _run_streaming(cmd, cwd=workspace_root, err_msg=(
         "Failed to create wheelhouse.\n"
-        f"Command: {' '.join(p.args if isinstance(p.args, list) else [str(p.args)])}\n"
-        f"{p.stdout}\n{p.stderr}"
+        f"Command: {' '.join(cmd)}"
     ))
 
 
@@ -799,28 +923,22 @@ def pip_install_requirements_file(
     if not requirements_path.exists():
         raise Exception(f"Requirements file not found: {requirements_path}")
 
-    if shutil.which("uv") is None:
+    uv = _uv_path()
+    if uv is None:
         raise Exception("Required command not found in PATH: uv")
 
     # Installing requirements from wheelhouse (always offline)
     pip_cmd: list[str] = [
-        "uv", "pip", "sync", "-p", str(venv_python),
+        uv, "pip", "sync", "-p", str(venv_python),
         "--offline", "--no-index",
         "-f", str(wheelhouse_dir),
         str(requirements_path),
     ]
 
     _logger.info("Installing requirements from wheelhouse: %s", requirements_path)
-    p = subprocess.run(
-        pip_cmd,
-        cwd=str(workspace_root),
-        text=True,
-        capture_output=True,
-    )
-    _handle_process_output(p, err_msg=(
+    _run_streaming(pip_cmd, cwd=workspace_root, err_msg=(
         "Failed to install requirements from wheelhouse.\n"
-        f"Command: {' '.join(p.args if isinstance(p.args, list) else [str(p.args)])}\n"
-        f"{p.stdout}\n{p.stderr}"
+        f"Command: {' '.join(pip_cmd)}"
     ))
 
 
@@ -828,21 +946,30 @@ def pip_install_requirements_file(
 # Git operations
 # -----------------------------
 
+# Resolved once at import so every git exec skips the $PATH walk execvp would
+# otherwise do. Falls back to plain "git" when not found; the first actual use
+# then fails with the usual "No such file" error.
+_GIT = shutil.which("git") or "git"
+
+
 def _run(cmd: list[str], cwd: Optional[Path] = None) -> str:
     # Log every git command we execute (stdout only; configured in main()).
-    if cmd and cmd[0] == "git":
+    is_git = bool(cmd) and cmd[0] == "git"
+    if is_git:
         _logger.info("git: %s (cwd=%s)", " ".join(cmd), str(cwd) if cwd else "<cwd>")
+        cmd = [_GIT, *cmd[1:]]
 
     p = subprocess.run(
         cmd,
         cwd=str(cwd) if cwd else None,
         text=True,
         capture_output=True,
+        close_fds=False,  # no sensitive fds to hide; skips the close loop
     )
 
     out = (p.stdout or "").strip()
     err = (p.stderr or "").strip()
-    if cmd and cmd[0] == "git":
+    if is_git:
         if out:
             _logger.info("git stdout: %s", out)
         if err:
@@ -852,10 +979,20 @@ def _run(cmd: list[str], cwd: Optional[Path] = None) -> str:
     return out
 
 
+def _git_status_clean(repo_dir: Path) -> bool:
+    """Return True when the worktree has no pending changes.
+
+    One `git status --porcelain=v2 -z` exec covers staged, unstaged and
+    untracked entries; the null-delimited v2 format is unambiguous even for
+    paths containing spaces or newlines.
+    """
+    out = _run(["git", "status", "--porcelain=v2", "-z"], cwd=repo_dir)
+    return not out.strip("\0").strip()
+
+
 def assert_clean_worktree(repo_dir: Path) -> None:
     _logger.info("assert_clean_worktree: %s", repo_dir)
-    out = _run(["git", "status", "--porcelain"], cwd=repo_dir)
-    if out.strip():
+    if not _git_status_clean(repo_dir):
         raise Exception(
             f"Local changes detected in repository: {repo_dir}\n"
             "You must commit and push your local changes (or clean the working tree) before syncing.\n"
@@ -872,6 +1009,112 @@ def _is_shallow_repo(repo_dir: Path) -> bool:
     return (repo_dir / ".git" / "shallow").exists()
 
 
+# .git/config rarely changes within one invocation; cache the parsed dump per
+# repo keyed by the file's (mtime_ns, size) so repeated reads cost one stat.
+_GIT_CONFIG_CACHE: Dict[Path, tuple[tuple[int, int], Dict[str, list[str]]]] = {}
+
+
+def _git_config_stamp(repo_dir: Path) -> Optional[tuple[int, int]]:
+    try:
+        st = (repo_dir / ".git" / "config").stat()
+    except OSError:
+        # .git may be a gitfile (worktrees/submodules); skip caching then.
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+_GIT_CONFIG_SECTION_RE = re.compile(r'([^ "]+)(?:\s+"(.*)")?$')
+
+
+def _parse_git_config_text(text: str) -> Dict[str, list[str]]:
+    """Parse a plain .git/config into key -> list of values.
+
+    Handles the subset git itself writes for clones (sections, quoted
+    subsections, multi-valued keys). Raises ValueError on constructs we do not
+    support (include directives, line continuations) so the caller can fall
+    back to asking git.
+    """
+    config: Dict[str, list[str]] = {}
+    section = ""
+
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or line.startswith(("#", ";")):
+            continue
+        if line.endswith("\\"):
+            raise ValueError("line continuation in git config")
+
+        if line.startswith("[") and line.endswith("]"):
+            header = line[1:-1].strip()
+            m = _GIT_CONFIG_SECTION_RE.match(header)
+            if not m:
+                raise ValueError(f"unsupported git config section: {raw}")
+            section = m.group(1).lower()
+            if section.startswith("include"):
+                raise ValueError("include directive in git config")
+            if m.group(2) is not None:
+                section = f"{section}.{m.group(2)}"
+            continue
+
+        key, sep, value = line.partition("=")
+        key = key.strip().lower()
+        value = value.strip() if sep else "true"
+        if value.startswith('"'):
+            raise ValueError("quoted value in git config")
+        if section and key:
+            config.setdefault(f"{section}.{key}", []).append(value)
+
+    return config
+
+
+def _read_git_config(repo_dir: Path) -> Dict[str, list[str]]:
+    """Read the repository-local git config without spawning git when possible.
+
+    Returns key -> list of values (multi-valued keys like remote.origin.fetch
+    keep every entry). The common case parses .git/config directly in Python;
+    exotic configs (includes, continuations, gitfile worktrees) fall back to a
+    single `git config --list -z` exec. The parsed result is cached until the
+    config file changes on disk.
+    """
+    stamp = _git_config_stamp(repo_dir)
+    if stamp is not None:
+        cached = _GIT_CONFIG_CACHE.get(repo_dir)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+    config: Optional[Dict[str, list[str]]] = None
+    if stamp is not None:
+        try:
+            config = _parse_git_config_text(
+                (repo_dir / ".git" / "config").read_text(encoding="utf-8")
+            )
+        except (OSError, ValueError):
+            config = None
+
+    if config is None:
+        p = subprocess.run(
+            [_GIT, "config", "--list", "-z", "--local"],
+            cwd=str(repo_dir),
+            text=True,
+            capture_output=True,
+            close_fds=False,
+        )
+
+        config = {}
+        if p.returncode != 0:
+            return config
+        for entry in (p.stdout or "").split("\0"):
+            if not entry:
+                continue
+            # -z entries are "key\nvalue"; values may themselves contain newlines.
+            key, _, value = entry.partition("\n")
+            config.setdefault(key, []).append(value)
+
+    if stamp is not None:
+        _GIT_CONFIG_CACHE[repo_dir] = (stamp, config)
+    return config
+
+
 def _ensure_full_origin_refspec(repo_dir: Path) -> None:
     """Ensure origin is configured to fetch all branches.
 
@@ -881,24 +1124,84 @@ def _ensure_full_origin_refspec(repo_dir: Path) -> None:
     """
     wildcard = "+refs/heads/*:refs/remotes/origin/*"
 
-    p = subprocess.run(
-        ["git", "config", "--get-all", "remote.origin.fetch"],
-        cwd=str(repo_dir),
-        text=True,
-        capture_output=True,
-    )
-    existing = [ln.strip() for ln in (p.stdout or "").splitlines() if ln.strip()]
+    existing = _read_git_config(repo_dir).get("remote.origin.fetch", [])
     if wildcard in existing:
         return
 
-    # Replace whatever refspec was there with a wildcard.
+    # Replace whatever refspec was there with a wildcard. The unset may fail
+    # when the key is absent; we ignore the outcome either way, so the output
+    # goes straight to DEVNULL instead of through capture pipes.
     subprocess.run(
-        ["git", "config", "--unset-all", "remote.origin.fetch"],
+        [_GIT, "config", "--unset-all", "remote.origin.fetch"],
         cwd=str(repo_dir),
-        text=True,
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=False,
     )
     _run(["git", "config", "--add", "remote.origin.fetch", wildcard], cwd=repo_dir)
+    # The config was just mutated; drop the cached dump.
+    _GIT_CONFIG_CACHE.pop(repo_dir, None)
+
+
+# In-process freshness gate for `git fetch`: repo_dir -> monotonic timestamp
+# of the last successful fetch in this process. With a TTL > 0 (set via the
+# ODT_ENV_FETCH_TTL_SEC environment variable), back-to-back sync steps that
+# touch the same repo skip the redundant network round-trip. Default is 0:
+# every fetch runs, exactly as before.
+_LAST_FETCH: Dict[Path, float] = {}
+
+
+def _fetch_ttl() -> float:
+    try:
+        return float(os.environ.get("ODT_ENV_FETCH_TTL_SEC", "0"))
+    except ValueError:
+        return 0.0
+
+
+def _fetch_is_fresh(repo_dir: Path) -> bool:
+    ttl = _fetch_ttl()
+    if ttl <= 0:
+        return False
+    if time.monotonic() - _LAST_FETCH.get(repo_dir, float("-inf")) < ttl:
+        _logger.info("Skipping fetch (last fetch within %ss): %s", ttl, repo_dir)
+        return True
+    return False
+
+
+def _mark_fetched(repo_dir: Path) -> None:
+    _LAST_FETCH[repo_dir] = time.monotonic()
+
+
+def _git_head_sha(repo_dir: Path) -> str:
+    """Read the SHA of HEAD straight from .git, without spawning git.
+
+    Returns "" when it cannot be determined (missing repo, unusual layout);
+    callers treat that as "unknown", which is always safe for cache keys.
+    """
+    git_dir = repo_dir / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return ""
+    if not head.startswith("ref: "):
+        return head  # detached HEAD: the SHA itself
+
+    ref = head[5:].strip()
+    try:
+        return (git_dir / ref).read_text(encoding="utf-8").strip()
+    except OSError:
+        pass
+    # The ref may live in packed-refs.
+    try:
+        for line in (git_dir / "packed-refs").read_text(encoding="utf-8").splitlines():
+            if line.startswith(("#", "^")):
+                continue
+            sha, _, name = line.partition(" ")
+            if name.strip() == ref:
+                return sha
+    except OSError:
+        pass
+    return ""
 
 
 def _unshallow_if_needed(repo_dir: Path) -> None:
@@ -911,19 +1214,26 @@ def _unshallow_if_needed(repo_dir: Path) -> None:
     _run(["git", "fetch", "--unshallow", "--tags", "origin"], cwd=repo_dir)
 
 
-def _fetch_branch(repo_dir: Path, branch: Optional[str], depth: Optional[int] = None) -> None:
+def _fetch_branch(repo_dir: Path, branch: Optional[str], depth: Optional[int] = None,
+                  partial: bool = False) -> None:
     """Fetch only the requested branch from origin.
 
     When `depth` is provided, the fetch stays shallow. When omitted, the fetch uses
-    full history for the requested branch only.
+    full history for the requested branch only. `partial` keeps the fetch
+    blobless (`--filter=blob:none`) to match a partial clone.
     """
+    if _fetch_is_fresh(repo_dir):
+        return
     fetch_cmd: list[str] = ["git", "fetch", "--prune"]
     if depth is not None:
         fetch_cmd += ["--depth", str(depth)]
+    if partial:
+        fetch_cmd += ["--filter=blob:none"]
     fetch_cmd += ["origin"]
     if branch:
         fetch_cmd += [branch]
     _run(fetch_cmd, cwd=repo_dir)
+    _mark_fetched(repo_dir)
 
 
 def ensure_repo(
@@ -933,6 +1243,7 @@ def ensure_repo(
         depth: Optional[int] = None,
         single_branch: bool = False,
         fetch_all: bool = True,
+        partial: bool = False,
 ) -> None:
     """
     Ensure a git repository exists at `dest`.
@@ -941,47 +1252,83 @@ def ensure_repo(
       * If `branch` is provided, the clone will initially checkout that branch.
       * If `single_branch` is True, only that branch will be fetched/kept.
       * If `depth` is provided, the clone will be shallow (depth=N).
+      * If `partial` is True, the clone uses `--filter=blob:none`: full history,
+        but blobs are only transferred when a checkout (or diff/log -p) needs
+        them. Unlike shallow clones this never requires an `--unshallow`
+        round-trip later.
 
     - If the repo exists, it is fetched/updated according to the chosen strategy:
       * fetch_all=True  -> `git fetch --all --prune`
       * fetch_all=False -> fetch only `branch` from origin (optionally shallow)
     """
-    _logger.info("ensure_repo: %s -> %s (branch=%s, depth=%s, single_branch=%s, fetch_all=%s)",
-                 repo_url, dest, branch, depth, single_branch, fetch_all)
+    _logger.info("ensure_repo: %s -> %s (branch=%s, depth=%s, single_branch=%s, fetch_all=%s, partial=%s)",
+                 repo_url, dest, branch, depth, single_branch, fetch_all, partial)
 
     if dest.exists() and (dest / ".git").exists():
         assert_clean_worktree(dest)
 
         if fetch_all:
             # If the caller wants a full clone/fetch and the repo is currently shallow
-            # or restricted to a single branch, convert it.
+            # or restricted to a single branch, convert it. Partial clones already
+            # have full history, so unshallowing them would only pull blobs early.
             if depth is None:
                 _ensure_full_origin_refspec(dest)
-                _unshallow_if_needed(dest)
-            _run(["git", "fetch", "--all", "--tags", "--prune"], cwd=dest)
+                if not partial:
+                    _unshallow_if_needed(dest)
+            if not _fetch_is_fresh(dest):
+                _run(["git", "fetch", "--all", "--tags", "--prune"], cwd=dest)
+                _mark_fetched(dest)
             return
 
         # Fetch only the required branch (useful for shallow/single-branch workflows).
-        if depth is None and _is_shallow_repo(dest):
+        if depth is None and not partial and _is_shallow_repo(dest):
             _unshallow_if_needed(dest)
 
-        _fetch_branch(dest, branch=branch, depth=depth)
+        _fetch_branch(dest, branch=branch, depth=depth, partial=partial)
         return
 
     dest.parent.mkdir(parents=True, exist_ok=True)
 
     cmd: list[str] = ["git", "clone"]
     if depth is not None:
-        cmd += ["--depth", str(depth)]
+        # Shallow clones also use a partial-clone filter so historical blobs
+        # are never transferred; blobs needed for checkout are fetched on demand.
+        cmd += ["--depth", str(depth), "--filter=blob:none"]
+    else:
+        if partial:
+            cmd += ["--filter=blob:none"]
+        # Full-history clones: let git fetch submodules in parallel.
+        cmd += ["--jobs", str(os.cpu_count() or 1)]
     if branch is not None:
         cmd += ["--branch", branch]
     if single_branch:
         cmd += ["--single-branch"]
     cmd += [repo_url, str(dest)]
     _run(cmd)
+    _mark_fetched(dest)
 
 
-def checkout_branch(dest: Path, branch: str, fetch_all: bool = True, depth: Optional[int] = None) -> None:
+def ensure_repos_parallel(specs: list[Dict[str, Any]], max_workers: int = 8) -> None:
+    """Run ensure_repo for several repositories concurrently.
+
+    Each spec is a dict of ensure_repo keyword arguments. The calls are
+    independent network-bound git subprocesses, so wall time approaches the
+    slowest repo instead of the sum. The first failure is re-raised.
+    """
+    if not specs:
+        return
+    if len(specs) == 1:
+        ensure_repo(**specs[0])
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(specs))) as ex:
+        futures = [ex.submit(ensure_repo, **spec) for spec in specs]
+        for future in futures:
+            future.result()
+
+
+def checkout_branch(dest: Path, branch: str, fetch_all: bool = True, depth: Optional[int] = None,
+                    partial: bool = False) -> None:
     """
     Checkout the requested `branch` in an existing repo.
 
@@ -991,8 +1338,12 @@ def checkout_branch(dest: Path, branch: str, fetch_all: bool = True, depth: Opti
     - fetch_all=False: fetch ONLY `origin/<branch>` (optionally shallow via depth),
       then force local branch `<branch>` to match `origin/<branch>`.
       This is intended for the Odoo repo where we want single-branch + shallow clones.
+
+    - partial=True keeps fetches blobless (`--filter=blob:none`) and skips the
+      unshallow conversion; blobs materialize at checkout.
     """
-    _logger.info("checkout_branch: %s @ %s (fetch_all=%s, depth=%s)", dest, branch, fetch_all, depth)
+    _logger.info("checkout_branch: %s @ %s (fetch_all=%s, depth=%s, partial=%s)",
+                 dest, branch, fetch_all, depth, partial)
     assert_clean_worktree(dest)
 
     if fetch_all:
@@ -1000,8 +1351,14 @@ def checkout_branch(dest: Path, branch: str, fetch_all: bool = True, depth: Opti
         # or restricted to a single branch, convert it.
         if depth is None:
             _ensure_full_origin_refspec(dest)
-            _unshallow_if_needed(dest)
-        _run(["git", "fetch", "--all", "--tags", "--prune"], cwd=dest)
+            if not partial:
+                _unshallow_if_needed(dest)
+        if not _fetch_is_fresh(dest):
+            fetch_all_cmd = ["git", "fetch", "--all", "--tags", "--prune"]
+            if partial:
+                fetch_all_cmd.append("--filter=blob:none")
+            _run(fetch_all_cmd, cwd=dest)
+            _mark_fetched(dest)
 
         try:
             _run(["git", "rev-parse", "--verify", f"origin/{branch}"], cwd=dest)
@@ -1016,14 +1373,25 @@ def checkout_branch(dest: Path, branch: str, fetch_all: bool = True, depth: Opti
         return
 
     # Narrow fetch: only the needed branch, optionally shallow.
-    fetch_cmd: list[str] = ["git", "fetch", "--prune"]
-    if depth is not None:
-        fetch_cmd += ["--depth", str(depth)]
-    fetch_cmd += ["origin", branch]
-    _run(fetch_cmd, cwd=dest)
-
-    _run(["git", "rev-parse", "--verify", f"origin/{branch}"], cwd=dest)
-    _run(["git", "checkout", "-B", branch, f"origin/{branch}"], cwd=dest)
+    if not _fetch_is_fresh(dest):
+        fetch_cmd: list[str] = ["git", "fetch", "--prune"]
+        if depth is not None:
+            fetch_cmd += ["--depth", str(depth)]
+        if partial:
+            fetch_cmd += ["--filter=blob:none"]
+        fetch_cmd += ["origin", branch]
+        _run(fetch_cmd, cwd=dest)
+        _mark_fetched(dest)
+
+    # No separate rev-parse probe: checkout -B fails just the same when the
+    # remote-tracking ref is missing, so the extra exec bought nothing.
+    try:
+        _run(["git", "checkout", "-B", branch, f"origin/{branch}"], cwd=dest)
+    except Exception as e:
+        raise Exception(
+            f"Branch 'origin/{branch}' not found (or checkout failed) in {dest}.\n"
+            f"Check that branch '{branch}' exists on the remote."
+        ) from e
     # Ensure the working tree exactly matches the remote branch (no pull, no extra refs).
     _run(["git", "reset", "--hard", f"origin/{branch}"], cwd=dest)
     assert_clean_worktree(dest)
@@ -1037,6 +1405,61 @@ def _has_commit(repo_dir: Path, commit: str) -> bool:
         return False
 
 
+class _GitSession:
+    """Long-running `git cat-file --batch-check` plumbing for one repository.
+
+    checkout_commit may probe the same repo several times while deepening a
+    shallow history; a persistent plumbing process answers those probes over
+    stdin/stdout instead of paying fork+exec per check.
+    """
+
+    def __init__(self, repo_dir: Path):
+        self.repo_dir = repo_dir
+        self._proc: Optional[subprocess.Popen] = None
+
+    def _ensure_proc(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                [_GIT, "cat-file", "--batch-check"],
+                cwd=str(self.repo_dir),
+                text=True,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._proc
+
+    def contains(self, rev: str) -> Optional[bool]:
+        """Return whether `rev` resolves to an object; None means probe failed
+        (caller should fall back to a one-shot git invocation)."""
+        try:
+            p = self._ensure_proc()
+            p.stdin.write(rev + "\n")
+            p.stdin.flush()
+            line = p.stdout.readline()
+        except Exception:
+            self.close()
+            return None
+
+        if not line:
+            self.close()
+            return None
+
+        parts = line.split()
+        return len(parts) == 3 and parts[1] in ("commit", "tag", "tree", "blob")
+
+    def close(self) -> None:
+        if self._proc is None:
+            return
+        try:
+            if self._proc.stdin:
+                self._proc.stdin.close()
+            self._proc.wait(timeout=5)
+        except Exception:
+            self._proc.kill()
+        self._proc = None
+
+
 def checkout_commit(
         dest: Path,
         commit: str,
@@ -1060,48 +1483,61 @@ def checkout_commit(
     )
     assert_clean_worktree(dest)
 
-    if fetch_all:
-        if depth is None:
-            _ensure_full_origin_refspec(dest)
-            _unshallow_if_needed(dest)
-        _run(["git", "fetch", "--all", "--tags", "--prune"], cwd=dest)
-    else:
-        if branch:
-            _fetch_branch(dest, branch=branch, depth=depth)
+    # The reachability probes below may run several times while deepening a
+    # shallow history; answer them via one persistent plumbing process.
+    session = _GitSession(dest)
+
+    def _commit_reachable() -> bool:
+        found = session.contains(f"{commit}^{{commit}}")
+        if found is None:
+            return _has_commit(dest, commit)
+        return found
+
+    try:
+        if fetch_all:
+            if depth is None:
+                _ensure_full_origin_refspec(dest)
+                _unshallow_if_needed(dest)
+            _run(["git", "fetch", "--all", "--tags", "--prune"], cwd=dest)
+        else:
+            if branch:
+                _fetch_branch(dest, branch=branch, depth=depth)
 
-    if not _has_commit(dest, commit) and not fetch_all and branch and depth is not None:
-        for deepen_by in (50, 200, 1000):
+        if not _commit_reachable() and not fetch_all and branch and depth is not None:
+            for deepen_by in (50, 200, 1000):
+                _logger.info(
+                    "Commit %s not reachable yet on origin/%s; deepening shallow history by %s.",
+                    commit,
+                    branch,
+                    deepen_by,
+                )
+                _run([
+                    "git", "fetch", "--prune", "--deepen", str(deepen_by), "origin", branch,
+                ], cwd=dest)
+                if _commit_reachable():
+                    break
+
+        if not _commit_reachable() and not fetch_all and branch:
             _logger.info(
-                "Commit %s not reachable yet on origin/%s; deepening shallow history by %s.",
+                "Commit %s still not reachable on origin/%s; fetching full history for that branch.",
                 commit,
                 branch,
-                deepen_by,
             )
-            _run([
-                "git", "fetch", "--prune", "--deepen", str(deepen_by), "origin", branch,
-            ], cwd=dest)
-            if _has_commit(dest, commit):
-                break
-
-    if not _has_commit(dest, commit) and not fetch_all and branch:
-        _logger.info(
-            "Commit %s still not reachable on origin/%s; fetching full history for that branch.",
-            commit,
-            branch,
-        )
-        if _is_shallow_repo(dest):
-            _run(["git", "fetch", "--unshallow", "--prune", "origin", branch], cwd=dest)
-        else:
-            _fetch_branch(dest, branch=branch, depth=None)
-
-    if not _has_commit(dest, commit):
-        try:
-            fallback_cmd = ["git", "fetch", "--prune", "origin", commit]
-            if depth is not None:
-                fallback_cmd[2:2] = ["--depth", str(depth)]
-            _run(fallback_cmd, cwd=dest)
-        except Exception:
-            pass
+            if _is_shallow_repo(dest):
+                _run(["git", "fetch", "--unshallow", "--prune", "origin", branch], cwd=dest)
+            else:
+                _fetch_branch(dest, branch=branch, depth=None)
+
+        if not _commit_reachable():
+            try:
+                fallback_cmd = ["git", "fetch", "--prune", "origin", commit]
+                if depth is not None:
+                    fallback_cmd[2:2] = ["--depth", str(depth)]
+                _run(fallback_cmd, cwd=dest)
+            except Exception:
+                pass
+    finally:
+        session.close()
 
     _run(["git", "rev-parse", "--verify", f"{commit}^{{commit}}"], cwd=dest)
     _run(["git", "checkout", "--detach", commit], cwd=dest)
@@ -1113,24 +1549,36 @@ def checkout_commit(
 # Odoo config generation
 # -----------------------------
 
+@functools.singledispatch
 def _format_conf_value(value: Any) -> str:
     # Render INI-parsed values into an Odoo .conf compatible scalar.
-    if isinstance(value, bool):
-        return "true" if value else "false"
-    if isinstance(value, (list, tuple)):
-        return ",".join(_format_conf_value(v) for v in value)
+    # Dispatch happens on the value's type (cached in C) instead of an
+    # isinstance ladder re-run per config key.
     return str(value)
 
 
+@_format_conf_value.register
+def _format_conf_bool(value: bool) -> str:
+    # Registered on bool directly; this takes precedence over any int
+    # handler that might be added later (bool subclasses int).
+    return "true" if value else "false"
+
+
+@_format_conf_value.register(list)
+@_format_conf_value.register(tuple)
+def _format_conf_sequence(value: Any) -> str:
+    return ",".join(_format_conf_value(v) for v in value)
+
+
 def _resolve_addon_path(layout: Layout, addon_name: str, spec: AddonSpec) -> Path:
     if spec.is_local:
         addon_path = Path((spec.path or "").strip()).expanduser()
         if not addon_path.is_absolute():
             addon_path = layout.root / addon_path
-        try:
-            return addon_path.resolve()
-        except Exception:
-            return addon_path.absolute()
+        # normpath is a pure string cleanup; resolve() would cost a realpath
+        # syscall per addon only to follow symlinks, which addons_path entries
+        # never need (Odoo opens them as given).
+        return Path(os.path.normpath(addon_path))
 
     return layout.addons_root / addon_name
 
@@ -1161,39 +1609,60 @@ def render_odoo_conf(cfg: Dict[str, Any], layout: Layout, addon_paths: list[Path
     ]
 
     # addons_path is always generated from Odoo core addons + every configured [addons.<name>] source.
-    merged: list[str] = []
-    seen: set[str] = set()
-    for p in [*odoo_addons_candidates, *addon_paths]:
-        s = str(p)
-        if s in seen:
-            continue
-        seen.add(s)
-        merged.append(s)
-    merged_addons_path = ",".join(merged)
+    # dict.fromkeys dedups while preserving first-seen order, all in C.
+    merged_addons_path = ",".join(
+        dict.fromkeys(str(p) for p in [*odoo_addons_candidates, *addon_paths])
+    )
 
-    lines: list[str] = ["[options]"]
+    def _iter_lines() -> Iterator[str]:
+        yield "[options]"
 
-    # Write every key from [config] (dynamic; no fixed schema), except values generated by odt-env.
-    for key, value in cfg.items():
-        if key == "data_dir":
-            continue
-        lines.append(f"{key} = {_format_conf_value(value)}")
+        # Write every key from [config] (dynamic; no fixed schema), except values generated by odt-env.
+        for key, value in cfg.items():
+            if key == "data_dir":
+                continue
+            yield f"{key} = {_format_conf_value(value)}"
 
-    # Always write generated addons_path.
-    lines.append(f"addons_path = {merged_addons_path}")
+        # Always write generated addons_path.
+        yield f"addons_path = {merged_addons_path}"
 
-    # Always write data_dir from layout
-    lines.append(f"data_dir = {layout.data_dir}")
+        # Always write data_dir from layout
+        yield f"data_dir = {layout.data_dir}"
 
-    return "\n".join(lines) + "\n"
+    # join consumes the generator directly; no intermediate list to grow.
+    return "\n".join(_iter_lines()) + "\n"
 
 
 # -----------------------------
 # Script generation
 # -----------------------------
 
-def write_run_sh(layout: Layout) -> None:
-    content = """#!/usr/bin/env bash
+def _write_if_changed(path: Path, content: str, newline: str = "\n") -> bool:
+    """Write `content` to `path` only when it differs from what is on disk.
+
+    Skipping identical rewrites keeps mtimes stable on no-op re-runs (no
+    spurious invalidation for downstream tools) and reduces the steady state
+    to a read + compare. `newline="\\r\\n"` translates line endings on the
+    encoded bytes, skipping the intermediate translated str. Returns True
+    when the file was (re)written.
+    """
+    data = content.encode("utf-8")
+    if newline != "\n":
+        data = data.replace(b"\n", newline.encode("ascii"))
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+# Shared building blocks for the generated scripts. These are plain strings
+# and small formatters rather than string.Template instances: Template's
+# $-placeholders would collide with bash's own ${...} syntax.
+
+_SH_PROLOGUE = """#!/usr/bin/env bash
 set -euo pipefail
 
 # Resolve script directory
@@ -1201,49 +1670,148 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 ROOT_DIR="$(cd "${SCRIPT_DIR}/.." && pwd)"
 
 VENV_DIR="${ROOT_DIR}/venv"
-PY="${VENV_DIR}/bin/python"
+"""
+
+_SH_CONF_VAR = 'CONF="${ROOT_DIR}/odoo-configs/odoo-server.conf"\n'
+
+_SH_ODOO_VARS = """PY="${VENV_DIR}/bin/python"
 ODOO_BIN="${ROOT_DIR}/odoo/odoo-bin"
 CONF="${ROOT_DIR}/odoo-configs/odoo-server.conf"
+"""
+
+
+def _sh_check(flag: str, var: str, msg: str) -> str:
+    return (
+        f'if [[ ! -{flag} "${{{var}}}" ]]; then\n'
+        f'  echo "ERROR: {msg} ${{{var}}}" >&2\n'
+        f'  exit 1\n'
+        f'fi\n'
+    )
+
+
+_SH_VENV_CHECK = _sh_check("d", "VENV_DIR", "required venv directory not found at")
+_SH_CONF_CHECK = _sh_check("f", "CONF", "Odoo config not found at")
+
+_SH_ODOO_CHECKS = "\n" + "".join([
+    _SH_VENV_CHECK,
+    _sh_check("x", "PY", "venv python not found/executable at"),
+    _sh_check("f", "ODOO_BIN", "odoo-bin not found at"),
+])
+
+_BAT_PROLOGUE = r"""@echo off
+setlocal enabledelayedexpansion
+
+REM Resolve ROOT directory (parent of this script directory)
+set SCRIPT_DIR=%~dp0
+if "%SCRIPT_DIR:~-1%"=="\" set SCRIPT_DIR=%SCRIPT_DIR:~0,-1%
+for %%I in ("%SCRIPT_DIR%\..") do set ROOT_DIR=%%~fI
+
+set VENV_DIR=%ROOT_DIR%\venv
+"""
 
-if [[ ! -d "${VENV_DIR}" ]]; then
-  echo "ERROR: required venv directory not found at ${VENV_DIR}" >&2
-  exit 1
-fi
-if [[ ! -x "${PY}" ]]; then
-  echo "ERROR: venv python not found/executable at ${PY}" >&2
-  exit 1
-fi
-if [[ ! -f "${ODOO_BIN}" ]]; then
-  echo "ERROR: odoo-bin not found at ${ODOO_BIN}" >&2
-  exit 1
-fi
-
-echo "INFO: Starting Odoo server using config ${CONF}. Passing through any extra arguments."
-exec "${PY}" "${ODOO_BIN}" -c "${CONF}" "$@"
+_BAT_CONF_VAR = "set CONF=%ROOT_DIR%\\odoo-configs\\odoo-server.conf\n"
+
+_BAT_ODOO_VARS = r"""set PY=%VENV_DIR%\Scripts\python.exe
+set ODOO_BIN=%ROOT_DIR%\odoo\odoo-bin
+set CONF=%ROOT_DIR%\odoo-configs\odoo-server.conf
 """
-    layout.scripts_dir.mkdir(parents=True, exist_ok=True)
-    layout.script("run", "sh").write_text(content, encoding="utf-8")
 
+
+def _bat_check(var: str, msg: str) -> str:
+    return (
+        f'if not exist "%{var}%" (\n'
+        f'  echo ERROR: {msg} %{var}%\n'
+        f'  exit /b 1\n'
+        f')\n'
+    )
+
+
+_BAT_VENV_CHECK = _bat_check("VENV_DIR", "required venv directory not found at")
+_BAT_CONF_CHECK = _bat_check("CONF", "Odoo config not found at")
+
+_BAT_ODOO_CHECKS = "\n" + "".join([
+    _BAT_VENV_CHECK,
+    _bat_check("PY", "venv python not found at"),
+    _bat_check("ODOO_BIN", "odoo-bin not found at"),
+])
+
+
+def _chmod_executable(path: Path) -> None:
+    # We created the file ourselves, so a fixed rwxr-xr-x is fine; setting it
+    # in one chmod avoids the stat+chmod round-trip of mask-merging.
     try:
-        mode = layout.script("run", "sh").stat().st_mode
-        layout.script("run", "sh").chmod(mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        os.chmod(path, 0o755)
     except OSError:
         pass
 
 
-def write_instance_sh(layout: Layout) -> None:
-    content = """#!/usr/bin/env bash
-set -euo pipefail
+def _write_sh_script(layout: Layout, name: str, content: str) -> None:
+    layout.scripts_dir.mkdir(parents=True, exist_ok=True)
+    path = layout.script(name, "sh")
+    _write_if_changed(path, content)
+    _chmod_executable(path)
 
-# Resolve script directory
-SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-ROOT_DIR="$(cd "${SCRIPT_DIR}/.." && pwd)"
 
-VENV_DIR="${ROOT_DIR}/venv"
-PY="${VENV_DIR}/bin/python"
-ODOO_BIN="${ROOT_DIR}/odoo/odoo-bin"
-CONF="${ROOT_DIR}/odoo-configs/odoo-server.conf"
+def _write_bat_script(layout: Layout, name: str, content: str) -> None:
+    layout.scripts_dir.mkdir(parents=True, exist_ok=True)
+    _write_if_changed(layout.script(name, "bat"), content, newline="\r\n")
+
+
+def _write_script(path: Path, content: str, executable: bool) -> None:
+    """Write one rendered script (sh when executable, bat otherwise).
+
+    Used by sync_project's batch path, where the scripts directory already
+    exists; keeps the content-compared write so no-op runs stay mtime-stable.
+    """
+    if executable:
+        _write_if_changed(path, content)
+        _chmod_executable(path)
+    else:
+        _write_if_changed(path, content, newline="\r\n")
+
+
+# The plain odoo-bin wrappers differ only in their log message and the
+# arguments around `-c CONF`; they are produced from this table by the two
+# emitters below. Scripts with bespoke variable blocks (instance, update,
+# backup, restore) stay hand-assembled.
+_ODOO_SCRIPTS: Dict[str, tuple[str, str, str]] = {
+    # name: (message, args before -c, args after CONF)
+    "run": ("Starting Odoo server", "", ""),
+    "test": ("Running Odoo tests", "", " --test-enable --stop-after-init"),
+    "shell": ("Starting Odoo shell", "shell ", ""),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _emit_odoo_sh(message: str, pre: str, post: str) -> str:
+    return (
+        _SH_PROLOGUE
+        + _SH_ODOO_VARS
+        + _SH_ODOO_CHECKS
+        + f'\necho "INFO: {message} using config ${{CONF}}. Passing through any extra arguments."\n'
+        + f'exec "${{PY}}" "${{ODOO_BIN}}" {pre}-c "${{CONF}}"{post} "$@"\n'
+    )
 
+
+@functools.lru_cache(maxsize=None)
+def _emit_odoo_bat(message: str, pre: str, post: str) -> str:
+    return (
+        _BAT_PROLOGUE
+        + _BAT_ODOO_VARS
+        + _BAT_ODOO_CHECKS
+        + f"\necho INFO: {message} using config %CONF%. Passing through any extra arguments.\n"
+        + f'"%PY%" "%ODOO_BIN%" {pre}-c "%CONF%"{post} %*\n'
+        + "\nendlocal\n"
+    )
+
+
+def write_run_sh(layout: Layout) -> None:
+    _write_sh_script(layout, "run", _emit_odoo_sh(*_ODOO_SCRIPTS["run"]))
+
+
+@functools.lru_cache(maxsize=None)
+def _emit_instance_sh() -> str:
+    content = _SH_PROLOGUE + _SH_ODOO_VARS + """
 LOGS_DIR="${ROOT_DIR}/odoo-logs"
 LOG_FILE="${LOGS_DIR}/odoo-server.log"
 PID_FILE="${LOGS_DIR}/odoo-server.pid"
@@ -1363,459 +1931,217 @@ case "${cmd}" in
     ;;
 esac
 """
-    layout.scripts_dir.mkdir(parents=True, exist_ok=True)
-    layout.script("instance", "sh").write_text(content, encoding="utf-8")
-
-    try:
-        mode = layout.script("instance", "sh").stat().st_mode
-        layout.script("instance", "sh").chmod(mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-    except OSError:
-        pass
+    return content
 
 
-def write_run_bat(layout: Layout) -> None:
-    content = r"""@echo off
-setlocal enabledelayedexpansion
-
-REM Resolve ROOT directory (parent of this script directory)
-set SCRIPT_DIR=%~dp0
-if "%SCRIPT_DIR:~-1%"=="\" set SCRIPT_DIR=%SCRIPT_DIR:~0,-1%
-for %%I in ("%SCRIPT_DIR%\..") do set ROOT_DIR=%%~fI
+def write_instance_sh(layout: Layout) -> None:
+    _write_sh_script(layout, "instance", _emit_instance_sh())
 
-set VENV_DIR=%ROOT_DIR%\venv
-set PY=%VENV_DIR%\Scripts\python.exe
-set ODOO_BIN=%ROOT_DIR%\odoo\odoo-bin
-set CONF=%ROOT_DIR%\odoo-configs\odoo-server.conf
 
-if not exist "%VENV_DIR%" (
-  echo ERROR: required venv directory not found at %VENV_DIR%
-  exit /b 1
-)
-if not exist "%PY%" (
-  echo ERROR: venv python not found at %PY%
-  exit /b 1
-)
-if not exist "%ODOO_BIN%" (
-  echo ERROR: odoo-bin not found at %ODOO_BIN%
-  exit /b 1
-)
-
-echo INFO: Starting Odoo server using config %CONF%. Passing through any extra arguments.
-"%PY%" "%ODOO_BIN%" -c "%CONF%" %*
-
-endlocal
-"""
-    layout.scripts_dir.mkdir(parents=True, exist_ok=True)
-    layout.script("run", "bat").write_text(content.replace("\n", "\r\n"), encoding="utf-8")
+def write_run_bat(layout: Layout) -> None:
+    _write_bat_script(layout, "run", _emit_odoo_bat(*_ODOO_SCRIPTS["run"]))
 
 
 def write_test_sh(layout: Layout) -> None:
-    content = """#!/usr/bin/env bash
-set -euo pipefail
-
-# Resolve script directory
-SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-ROOT_DIR="$(cd "${SCRIPT_DIR}/.." && pwd)"
-
-VENV_DIR="${ROOT_DIR}/venv"
-PY="${VENV_DIR}/bin/python"
-ODOO_BIN="${ROOT_DIR}/odoo/odoo-bin"
-CONF="${ROOT_DIR}/odoo-configs/odoo-server.conf"
-
-if [[ ! -d "${VENV_DIR}" ]]; then
-  echo "ERROR: required venv directory not found at ${VENV_DIR}" >&2
-  exit 1
-fi
-if [[ ! -x "${PY}" ]]; then
-  echo "ERROR: venv python not found/executable at ${PY}" >&2
-  exit 1
-fi
-if [[ ! -f "${ODOO_BIN}" ]]; then
-  echo "ERROR: odoo-bin not found at ${ODOO_BIN}" >&2
-  exit 1
-fi
-
-echo "INFO: Running Odoo tests using config ${CONF}. Passing through any extra arguments."
-exec "${PY}" "${ODOO_BIN}" -c "${CONF}" --test-enable --stop-after-init "$@"
-"""
-    layout.scripts_dir.mkdir(parents=True, exist_ok=True)
-    layout.script("test", "sh").write_text(content, encoding="utf-8")
-
-    try:
-        mode = layout.script("test", "sh").stat().st_mode
-        layout.script("test", "sh").chmod(mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-    except OSError:
-        pass
+    _write_sh_script(layout, "test", _emit_odoo_sh(*_ODOO_SCRIPTS["test"]))
 
 
 def write_test_bat(layout: Layout) -> None:
-    content = r"""@echo off
-setlocal enabledelayedexpansion
-
-REM Resolve ROOT directory (parent of this script directory)
-set SCRIPT_DIR=%~dp0
-if "%SCRIPT_DIR:~-1%"=="\" set SCRIPT_DIR=%SCRIPT_DIR:~0,-1%
-for %%I in ("%SCRIPT_DIR%\..") do set ROOT_DIR=%%~fI
-
-set VENV_DIR=%ROOT_DIR%\venv
-set PY=%VENV_DIR%\Scripts\python.exe
-set ODOO_BIN=%ROOT_DIR%\odoo\odoo-bin
-set CONF=%ROOT_DIR%\odoo-configs\odoo-server.conf
-
-if not exist "%VENV_DIR%" (
-  echo ERROR: required venv directory not found at %VENV_DIR%
-  exit /b 1
-)
-if not exist "%PY%" (
-  echo ERROR: venv python not found at %PY%
-  exit /b 1
-)
-if not exist "%ODOO_BIN%" (
-  echo ERROR: odoo-bin not found at %ODOO_BIN%
-  exit /b 1
-)
-
-echo INFO: Running Odoo tests using config %CONF%. Passing through any extra arguments.
-"%PY%" "%ODOO_BIN%" -c "%CONF%" --test-enable --stop-after-init %*
-
-endlocal
-"""
-    layout.scripts_dir.mkdir(parents=True, exist_ok=True)
-    layout.script("test", "bat").write_text(content.replace("\n", "\r\n"), encoding="utf-8")
+    _write_bat_script(layout, "test", _emit_odoo_bat(*_ODOO_SCRIPTS["test"]))
 
 
 def write_shell_sh(layout: Layout) -> None:
-    content = """#!/usr/bin/env bash
-set -euo pipefail
-
-# Resolve script directory
-SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-ROOT_DIR="$(cd "${SCRIPT_DIR}/.." && pwd)"
-
-VENV_DIR="${ROOT_DIR}/venv"
-PY="${VENV_DIR}/bin/python"
-ODOO_BIN="${ROOT_DIR}/odoo/odoo-bin"
-CONF="${ROOT_DIR}/odoo-configs/odoo-server.conf"
-
-if [[ ! -d "${VENV_DIR}" ]]; then
-  echo "ERROR: required venv directory not found at ${VENV_DIR}" >&2
-  exit 1
-fi
-if [[ ! -x "${PY}" ]]; then
-  echo "ERROR: venv python not found/executable at ${PY}" >&2
-  exit 1
-fi
-if [[ ! -f "${ODOO_BIN}" ]]; then
-  echo "ERROR: odoo-bin not found at ${ODOO_BIN}" >&2
-  exit 1
-fi
-
-echo "INFO: Starting Odoo shell using config ${CONF}. Passing through any extra arguments."
-exec "${PY}" "${ODOO_BIN}" shell -c "${CONF}" "$@"
-"""
-    layout.scripts_dir.mkdir(parents=True, exist_ok=True)
-    layout.script("shell", "sh").write_text(content, encoding="utf-8")
-
-    try:
-        mode = layout.script("shell", "sh").stat().st_mode
-        layout.script("shell", "sh").chmod(mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-    except OSError:
-        pass
+    _write_sh_script(layout, "shell", _emit_odoo_sh(*_ODOO_SCRIPTS["shell"]))
 
 
 def write_shell_bat(layout: Layout) -> None:
-    content = r"""@echo off
-setlocal enabledelayedexpansion
-
-REM Resolve ROOT directory (parent of this script directory)
-set SCRIPT_DIR=%~dp0
-if "%SCRIPT_DIR:~-1%"=="\" set SCRIPT_DIR=%SCRIPT_DIR:~0,-1%
-for %%I in ("%SCRIPT_DIR%\..") do set ROOT_DIR=%%~fI
-
-set VENV_DIR=%ROOT_DIR%\venv
-set PY=%VENV_DIR%\Scripts\python.exe
-set ODOO_BIN=%ROOT_DIR%\odoo\odoo-bin
-set CONF=%ROOT_DIR%\odoo-configs\odoo-server.conf
-
-if not exist "%VENV_DIR%" (
-  echo ERROR: required venv directory not found at %VENV_DIR%
-  exit /b 1
-)
-if not exist "%PY%" (
-  echo ERROR: venv python not found at %PY%
-  exit /b 1
-)
-if not exist "%ODOO_BIN%" (
-  echo ERROR: odoo-bin not found at %ODOO_BIN%
-  exit /b 1
-)
-
-echo INFO: Starting Odoo shell using config %CONF%. Passing through any extra arguments.
-"%PY%" "%ODOO_BIN%" shell -c "%CONF%" %*
-
-endlocal
-"""
-    layout.scripts_dir.mkdir(parents=True, exist_ok=True)
-    layout.script("shell", "bat").write_text(content.replace("\n", "\r\n"), encoding="utf-8")
+    _write_bat_script(layout, "shell", _emit_odoo_bat(*_ODOO_SCRIPTS["shell"]))
+
+
+@functools.lru_cache(maxsize=8)
+def _emit_backup_sh(db_name: str) -> str:
+    content = (
+        _SH_PROLOGUE
+        + 'BACKUPS_DIR="${ROOT_DIR}/odoo-backups"\n'
+        + 'BACKUP_BIN="${VENV_DIR}/bin/click-odoo-backupdb"\n'
+        + _SH_CONF_VAR
+        + "\n"
+        + "TODAY=$(date +%Y%m%d)\n"
+        + "TIME=$(date +%H%M%S)\n"
+        + f'BACKUP_FILENAME="{db_name}_${{TODAY}}_${{TIME}}.zip"\n'
+        + 'FULL_BACKUP_PATH="${BACKUPS_DIR}/${BACKUP_FILENAME}"\n'
+        + "\n"
+        + _SH_VENV_CHECK
+        + _sh_check("d", "BACKUPS_DIR", "required odoo-backups directory not found at")
+        + _sh_check("x", "BACKUP_BIN", "click-odoo-backupdb not found/executable at")
+        + _SH_CONF_CHECK
+        + "\necho \"INFO: Creating new backup '${FULL_BACKUP_PATH}' using config ${CONF}. Passing through any extra arguments.\"\n"
+        + f'exec "${{BACKUP_BIN}}" -c "${{CONF}}" --format zip "{db_name}" "${{FULL_BACKUP_PATH}}" --log-level debug "$@"\n'
+    )
+    return content
 
 
 def write_backup_sh(layout: Layout, db_name: str) -> None:
-    content = f"""#!/usr/bin/env bash
-set -euo pipefail
-
-# Resolve script directory
-SCRIPT_DIR="$(cd "$(dirname "${{BASH_SOURCE[0]}}")" && pwd)"
-ROOT_DIR="$(cd "${{SCRIPT_DIR}}/.." && pwd)"
-
-VENV_DIR="${{ROOT_DIR}}/venv"
-BACKUPS_DIR="${{ROOT_DIR}}/odoo-backups"
-BACKUP_BIN="${{VENV_DIR}}/bin/click-odoo-backupdb"
-CONF="${{ROOT_DIR}}/odoo-configs/odoo-server.conf"
-
-TODAY=$(date +%Y%m%d)
-TIME=$(date +%H%M%S)
-BACKUP_FILENAME="{db_name}_${{TODAY}}_${{TIME}}.zip"
-FULL_BACKUP_PATH="${{BACKUPS_DIR}}/${{BACKUP_FILENAME}}"
-
-if [[ ! -d "${{VENV_DIR}}" ]]; then
-  echo "ERROR: required venv directory not found at ${{VENV_DIR}}" >&2
-  exit 1
-fi
-if [[ ! -d "${{BACKUPS_DIR}}" ]]; then
-  echo "ERROR: required odoo-backups directory not found at ${{BACKUPS_DIR}}" >&2
-  exit 1
-fi
-if [[ ! -x "${{BACKUP_BIN}}" ]]; then
-  echo "ERROR: click-odoo-backupdb not found/executable at ${{BACKUP_BIN}}" >&2
-  exit 1
-fi
-if [[ ! -f "${{CONF}}" ]]; then
-  echo "ERROR: Odoo config not found at ${{CONF}}" >&2
-  exit 1
-fi
-
-echo "INFO: Creating new backup '${{FULL_BACKUP_PATH}}' using config ${{CONF}}. Passing through any extra arguments."
-exec "${{BACKUP_BIN}}" -c "${{CONF}}" --format zip "{db_name}" "${{FULL_BACKUP_PATH}}" --log-level debug "$@"
-"""
-    layout.scripts_dir.mkdir(parents=True, exist_ok=True)
-    layout.script("backup", "sh").write_text(content, encoding="utf-8")
-
-    try:
-        mode = layout.script("backup", "sh").stat().st_mode
-        layout.script("backup", "sh").chmod(mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-    except OSError:
-        pass
+    _write_sh_script(layout, "backup", _emit_backup_sh(db_name))
+
+
+@functools.lru_cache(maxsize=8)
+def _emit_backup_bat(db_name: str) -> str:
+    content = (
+        _BAT_PROLOGUE
+        + "set BACKUPS_DIR=%ROOT_DIR%\\odoo-backups\n"
+        + "set BACKUP_BIN=%VENV_DIR%\\Scripts\\click-odoo-backupdb.exe\n"
+        + _BAT_CONF_VAR
+        + "\n"
+        + _BAT_VENV_CHECK
+        + _bat_check("BACKUPS_DIR", "required odoo-backups directory not found at")
+        + _bat_check("BACKUP_BIN", "click-odoo-backupdb not found at")
+        + _BAT_CONF_CHECK
+        + "\nREM Build timestamped filename (yyyyMMdd_HHmmss) via PowerShell for reliable formatting\n"
+        + "for /f %%i in ('powershell -NoProfile -Command \"Get-Date -Format yyyyMMdd\"') do set TODAY=%%i\n"
+        + "for /f %%i in ('powershell -NoProfile -Command \"Get-Date -Format HHmmss\"') do set TIME=%%i\n"
+        + "\n"
+        + f"set BACKUP_FILENAME={db_name}_%TODAY%_%TIME%.zip\n"
+        + "set FULL_BACKUP_PATH=%BACKUPS_DIR%\\%BACKUP_FILENAME%\n"
+        + '\necho INFO: Creating new backup "%FULL_BACKUP_PATH%" using config %CONF%. Passing through any extra arguments.\n'
+        + f'"%BACKUP_BIN%" -c "%CONF%" --format zip "{db_name}" "%FULL_BACKUP_PATH%" --log-level debug %*\n'
+        + "\nendlocal\n"
+    )
+    return content
 
 
 def write_backup_bat(layout: Layout, db_name: str) -> None:
-    content = rf"""@echo off
-setlocal enabledelayedexpansion
-
-REM Resolve ROOT directory (parent of this script directory)
-set SCRIPT_DIR=%~dp0
-if "%SCRIPT_DIR:~-1%"=="\" set SCRIPT_DIR=%SCRIPT_DIR:~0,-1%
-for %%I in ("%SCRIPT_DIR%\..") do set ROOT_DIR=%%~fI
-
-set VENV_DIR=%ROOT_DIR%\venv
-set BACKUPS_DIR=%ROOT_DIR%\odoo-backups
-set BACKUP_BIN=%VENV_DIR%\Scripts\click-odoo-backupdb.exe
-set CONF=%ROOT_DIR%\odoo-configs\odoo-server.conf
-
-if not exist "%VENV_DIR%" (
-  echo ERROR: required venv directory not found at %VENV_DIR%
-  exit /b 1
-)
-if not exist "%BACKUPS_DIR%" (
-  echo ERROR: required odoo-backups directory not found at %BACKUPS_DIR%
-  exit /b 1
-)
-if not exist "%BACKUP_BIN%" (
-  echo ERROR: click-odoo-backupdb not found at %BACKUP_BIN%
-  exit /b 1
-)
-if not exist "%CONF%" (
-  echo ERROR: Odoo config not found at %CONF%
-  exit /b 1
-)
-
-REM Build timestamped filename (yyyyMMdd_HHmmss) via PowerShell for reliable formatting
-for /f %%i in ('powershell -NoProfile -Command "Get-Date -Format yyyyMMdd"') do set TODAY=%%i
-for /f %%i in ('powershell -NoProfile -Command "Get-Date -Format HHmmss"') do set TIME=%%i
-
-set BACKUP_FILENAME={db_name}_%TODAY%_%TIME%.zip
-set FULL_BACKUP_PATH=%BACKUPS_DIR%\%BACKUP_FILENAME%
-
-echo INFO: Creating new backup "%FULL_BACKUP_PATH%" using config %CONF%. Passing through any extra arguments.
-"%BACKUP_BIN%" -c "%CONF%" --format zip "{db_name}" "%FULL_BACKUP_PATH%" --log-level debug %*
-
-endlocal
-"""
-    layout.scripts_dir.mkdir(parents=True, exist_ok=True)
-    layout.script("backup", "bat").write_text(content.replace("\n", "\r\n"), encoding="utf-8")
+    _write_bat_script(layout, "backup", _emit_backup_bat(db_name))
+
+
+@functools.lru_cache(maxsize=8)
+def _emit_restore_sh(db_name: str) -> str:
+    content = (
+        _SH_PROLOGUE
+        + 'RESTORE_BIN="${VENV_DIR}/bin/click-odoo-restoredb"\n'
+        + _SH_CONF_VAR
+        + "\n"
+        + _SH_VENV_CHECK
+        + _sh_check("x", "RESTORE_BIN", "click-odoo-restoredb not found/executable at")
+        + _SH_CONF_CHECK
+        + "\n"
+        + 'if [[ $# -lt 1 ]]; then\n'
+        + '  echo "ERROR: missing restore source (backup file/path). Provide it as the first argument." >&2\n'
+        + '  echo "Example: ./restore.sh /path/to/backup.zip" >&2\n'
+        + '  exit 2\n'
+        + 'fi\n'
+        + f"\necho \"INFO: Restoring Odoo database '{db_name}' using config ${{CONF}}. Passing through any extra arguments.\"\n"
+        + f'exec "${{RESTORE_BIN}}" -c "${{CONF}}" --copy --neutralize --log-level debug "{db_name}" "$@"\n'
+    )
+    return content
 
 
 def write_restore_sh(layout: Layout, db_name: str) -> None:
-    content = f"""#!/usr/bin/env bash
-set -euo pipefail
-
-# Resolve script directory
-SCRIPT_DIR="$(cd "$(dirname "${{BASH_SOURCE[0]}}")" && pwd)"
-ROOT_DIR="$(cd "${{SCRIPT_DIR}}/.." && pwd)"
-
-VENV_DIR="${{ROOT_DIR}}/venv"
-RESTORE_BIN="${{VENV_DIR}}/bin/click-odoo-restoredb"
-CONF="${{ROOT_DIR}}/odoo-configs/odoo-server.conf"
-
-if [[ ! -d "${{VENV_DIR}}" ]]; then
-  echo "ERROR: required venv directory not found at ${{VENV_DIR}}" >&2
-  exit 1
-fi
-if [[ ! -x "${{RESTORE_BIN}}" ]]; then
-  echo "ERROR: click-odoo-restoredb not found/executable at ${{RESTORE_BIN}}" >&2
-  exit 1
-fi
-if [[ ! -f "${{CONF}}" ]]; then
-  echo "ERROR: Odoo config not found at ${{CONF}}" >&2
-  exit 1
-fi
-
-if [[ $# -lt 1 ]]; then
-  echo "ERROR: missing restore source (backup file/path). Provide it as the first argument." >&2
-  echo "Example: ./restore.sh /path/to/backup.zip" >&2
-  exit 2
-fi
-
-echo "INFO: Restoring Odoo database '{db_name}' using config ${{CONF}}. Passing through any extra arguments."
-exec "${{RESTORE_BIN}}" -c "${{CONF}}" --copy --neutralize --log-level debug "{db_name}" "$@"
-"""
-    layout.scripts_dir.mkdir(parents=True, exist_ok=True)
-    layout.script("restore", "sh").write_text(content, encoding="utf-8")
-
-    try:
-        mode = layout.script("restore", "sh").stat().st_mode
-        layout.script("restore", "sh").chmod(mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-    except OSError:
-        pass
+    _write_sh_script(layout, "restore", _emit_restore_sh(db_name))
+
+
+@functools.lru_cache(maxsize=8)
+def _emit_restore_bat(db_name: str) -> str:
+    content = (
+        _BAT_PROLOGUE
+        + "set RESTORE_BIN=%VENV_DIR%\\Scripts\\click-odoo-restoredb.exe\n"
+        + _BAT_CONF_VAR
+        + "\n"
+        + _BAT_VENV_CHECK
+        + _bat_check("RESTORE_BIN", "click-odoo-restoredb not found at")
+        + _BAT_CONF_CHECK
+        + "\n"
+        + 'if "%~1"=="" (\n'
+        + "  echo ERROR: missing restore source ^(backup file/path^). Provide it as the first argument.\n"
+        + "  echo Example: restore.bat C:\\path\\to\\backup.zip\n"
+        + "  exit /b 2\n"
+        + ")\n"
+        + f'\necho INFO: Restoring Odoo database "{db_name}" using config %CONF%. Passing through any extra arguments.\n'
+        + f'"%RESTORE_BIN%" -c "%CONF%" --copy --neutralize --log-level debug "{db_name}" %*\n'
+        + "\nendlocal\n"
+    )
+    return content
 
 
 def write_restore_bat(layout: Layout, db_name: str) -> None:
-    content = rf"""@echo off
-setlocal enabledelayedexpansion
-
-REM Resolve ROOT directory (parent of this script directory)
-set SCRIPT_DIR=%~dp0
-if "%SCRIPT_DIR:~-1%"=="\" set SCRIPT_DIR=%SCRIPT_DIR:~0,-1%
-for %%I in ("%SCRIPT_DIR%\..") do set ROOT_DIR=%%~fI
-
-set VENV_DIR=%ROOT_DIR%\venv
-set RESTORE_BIN=%VENV_DIR%\Scripts\click-odoo-restoredb.exe
-set CONF=%ROOT_DIR%\odoo-configs\odoo-server.conf
-
-if not exist "%VENV_DIR%" (
-  echo ERROR: required venv directory not found at %VENV_DIR%
-  exit /b 1
-)
-if not exist "%RESTORE_BIN%" (
-  echo ERROR: click-odoo-restoredb not found at %RESTORE_BIN%
-  exit /b 1
-)
-if not exist "%CONF%" (
-  echo ERROR: Odoo config not found at %CONF%
-  exit /b 1
-)
-
-if "%~1"=="" (
-  echo ERROR: missing restore source ^(backup file/path^). Provide it as the first argument.
-  echo Example: restore.bat C:\path\to\backup.zip
-  exit /b 2
-)
-
-echo INFO: Restoring Odoo database "{db_name}" using config %CONF%. Passing through any extra arguments.
-"%RESTORE_BIN%" -c "%CONF%" --copy --neutralize --log-level debug "{db_name}" %*
-
-endlocal
-"""
-    layout.scripts_dir.mkdir(parents=True, exist_ok=True)
-    layout.script("restore", "bat").write_text(content.replace("\n", "\r\n"), encoding="utf-8")
+    _write_bat_script(layout, "restore", _emit_restore_bat(db_name))
+
+
+@functools.lru_cache(maxsize=None)
+def _emit_update_sh() -> str:
+    content = (
+        _SH_PROLOGUE
+        + 'UPDATE_BIN="${VENV_DIR}/bin/click-odoo-update"\n'
+        + _SH_CONF_VAR
+        + "\n"
+        + _SH_VENV_CHECK
+        + _sh_check("x", "UPDATE_BIN", "click-odoo-update not found/executable at")
+        + _SH_CONF_CHECK
+        + '\necho "INFO: Updating Odoo addons using config ${CONF}. Passing through any extra arguments."\n'
+        + 'exec "${UPDATE_BIN}" -c "${CONF}" --log-level debug "$@"\n'
+    )
+    return content
 
 
 def write_update_sh(layout: Layout) -> None:
-    content = f"""#!/usr/bin/env bash
-set -euo pipefail
-
-# Resolve script directory
-SCRIPT_DIR="$(cd "$(dirname "${{BASH_SOURCE[0]}}")" && pwd)"
-ROOT_DIR="$(cd "${{SCRIPT_DIR}}/.." && pwd)"
-
-VENV_DIR="${{ROOT_DIR}}/venv"
-UPDATE_BIN="${{VENV_DIR}}/bin/click-odoo-update"
-CONF="${{ROOT_DIR}}/odoo-configs/odoo-server.conf"
-
-if [[ ! -d "${{VENV_DIR}}" ]]; then
-  echo "ERROR: required venv directory not found at ${{VENV_DIR}}" >&2
-  exit 1
-fi
-if [[ ! -x "${{UPDATE_BIN}}" ]]; then
-  echo "ERROR: click-odoo-update not found/executable at ${{UPDATE_BIN}}" >&2
-  exit 1
-fi
-if [[ ! -f "${{CONF}}" ]]; then
-  echo "ERROR: Odoo config not found at ${{CONF}}" >&2
-  exit 1
-fi
-
-echo "INFO: Updating Odoo addons using config ${{CONF}}. Passing through any extra arguments."
-exec "${{UPDATE_BIN}}" -c "${{CONF}}" --log-level debug "$@"
-"""
-    layout.scripts_dir.mkdir(parents=True, exist_ok=True)
-    layout.script("update", "sh").write_text(content, encoding="utf-8")
-
-    try:
-        mode = layout.script("update", "sh").stat().st_mode
-        layout.script("update", "sh").chmod(mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-    except OSError:
-        pass
+    _write_sh_script(layout, "update", _emit_update_sh())
+
+
+@functools.lru_cache(maxsize=None)
+def _emit_update_bat() -> str:
+    content = (
+        _BAT_PROLOGUE
+        + "set UPDATE_BIN=%VENV_DIR%\\Scripts\\click-odoo-update.exe\n"
+        + _BAT_CONF_VAR
+        + "\n"
+        + _BAT_VENV_CHECK
+        + _bat_check("UPDATE_BIN", "click-odoo-update not found at")
+        + _BAT_CONF_CHECK
+        + "\necho INFO: Updating Odoo addons using config %CONF%. Passing through any extra arguments.\n"
+        + '"%UPDATE_BIN%" -c "%CONF%" --log-level debug %*\n'
+        + "\nendlocal\n"
+    )
+    return content
 
 
 def write_update_bat(layout: Layout) -> None:
-    content = rf"""@echo off
-setlocal enabledelayedexpansion
-
-REM Resolve ROOT directory (parent of this script directory)
-set SCRIPT_DIR=%~dp0
-if "%SCRIPT_DIR:~-1%"=="\" set SCRIPT_DIR=%SCRIPT_DIR:~0,-1%
-for %%I in ("%SCRIPT_DIR%\..") do set ROOT_DIR=%%~fI
-
-set VENV_DIR=%ROOT_DIR%\venv
-set UPDATE_BIN=%VENV_DIR%\Scripts\click-odoo-update.exe
-set CONF=%ROOT_DIR%\odoo-configs\odoo-server.conf
-
-if not exist "%VENV_DIR%" (
-  echo ERROR: required venv directory not found at %VENV_DIR%
-  exit /b 1
-)
-if not exist "%UPDATE_BIN%" (
-  echo ERROR: click-odoo-update not found at %UPDATE_BIN%
-  exit /b 1
-)
-if not exist "%CONF%" (
-  echo ERROR: Odoo config not found at %CONF%
-  exit /b 1
-)
-
-echo INFO: Updating Odoo addons using config %CONF%. Passing through any extra arguments.
-"%UPDATE_BIN%" -c "%CONF%" --log-level debug %*
-
-endlocal
-"""
-    layout.scripts_dir.mkdir(parents=True, exist_ok=True)
-    layout.script("update", "bat").write_text(content.replace("\n", "\r\n"), encoding="utf-8")
+    _write_bat_script(layout, "update", _emit_update_bat())
 
 
 # -----------------------------
 # Main logic
 # -----------------------------
 
+def _pipeline_fingerprint(
+        ini_path: Path,
+        req_files: list[Path],
+        repo_dirs: list[Path],
+        flags: tuple,
+) -> str:
+    """Fingerprint of everything the lock/wheelhouse build depends on.
+
+    Covers the INI bytes, each requirements file's bytes, each synced repo's
+    HEAD SHA (read from .git directly) and the relevant settings. A matching
+    fingerprint means the existing lock + wheelhouse are still valid.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    try:
+        h.update(ini_path.read_bytes())
+    except OSError:
+        pass
+    for req in req_files:
+        h.update(str(req).encode("utf-8"))
+        try:
+            h.update(req.read_bytes())
+        except OSError:
+            pass
+    for repo_dir in repo_dirs:
+        h.update(str(repo_dir).encode("utf-8"))
+        h.update(_git_head_sha(repo_dir).encode("utf-8"))
+    h.update(repr(flags).encode("utf-8"))
+    return h.hexdigest()
+
+
 def sync_project(
         ini_path: Path,
         sync_odoo: bool,
@@ -1829,7 +2155,9 @@ def sync_project(
         no_data_dir: bool = False,
         vars_overrides: Optional[Dict[str, str]] = None,
 ) -> None:
-    root = (root_override or ini_path.parent).resolve()
+    # Callers hand us absolute paths already (main() absolutizes ini_path and
+    # the --root override); abspath is a cheap no-op safeguard for API use.
+    root = Path(os.path.abspath(root_override or ini_path.parent))
     if root.exists() and not root.is_dir():
         raise Exception(f"ROOT exists but is not a directory: {root}")
     layout = Layout.from_root(root)
@@ -1842,10 +2170,7 @@ def sync_project(
         cfg_data_dir_path = Path(cfg_data_dir_raw.strip()).expanduser()
         if not cfg_data_dir_path.is_absolute():
             cfg_data_dir_path = layout.root / cfg_data_dir_path
-        try:
-            cfg_data_dir = cfg_data_dir_path.resolve()
-        except Exception:
-            cfg_data_dir = cfg_data_dir_path.absolute()
+        cfg_data_dir = Path(os.path.normpath(cfg_data_dir_path))
         _logger.warning(f"data_dir override via [config] section: from={layout.data_dir}, to={cfg_data_dir}")
         layout = replace(layout, data_dir=cfg_data_dir)
 
@@ -1859,14 +2184,14 @@ def sync_project(
             _logger.info("Recreating venv: removing %s", venv_dir)
             _rmtree(venv_dir)
 
-        # Wheelhouse handling: either reuse, or rebuild from scratch.
+        # Wheelhouse handling: either reuse, or rebuild from scratch. Deleting
+        # a stale wheelhouse is deferred to the compile step below, where the
+        # input fingerprint can tell whether the existing one is still valid.
         if reuse_wheelhouse:
-            if not layout.wheelhouse_dir.exists() or not layout.wheelhouse_dir.is_dir():
+            # is_dir() alone covers the missing-path case in a single stat.
+            if not layout.wheelhouse_dir.is_dir():
                 raise Exception(f"--create-venv-from-wheelhouse set but wheelhouse dir not found: {layout.wheelhouse_dir}")
         else:
-            if layout.wheelhouse_dir.exists():
-                _logger.info("Rebuilding wheelhouse: removing %s", layout.wheelhouse_dir)
-                _rmtree(layout.wheelhouse_dir)
             layout.wheelhouse_dir.mkdir(parents=True, exist_ok=True)
 
         # Create venv (requirements are installed later from a single lock file).
@@ -1876,7 +2201,7 @@ def sync_project(
             reuse_wheelhouse=reuse_wheelhouse,
             managed_python=cfg.virtualenv.managed_python,
         )
-        venv_py = venv_dir / ("Scripts/python.exe" if sys.platform.startswith("win") else "bin/python")
+        venv_py = venv_dir / _VENV_PY_SUFFIX
         if not venv_py.exists():
             raise Exception(f"venv python not found at expected path: {venv_py}")
 
@@ -1897,12 +2222,10 @@ def sync_project(
                 "No sync target selected; regenerating config and helper scripts only (skipping venv/repo operations)."
             )
 
-    layout.configs_dir.mkdir(parents=True, exist_ok=True)
-    layout.addons_root.mkdir(parents=True, exist_ok=True)
-    layout.scripts_dir.mkdir(parents=True, exist_ok=True)
-    layout.backups_dir.mkdir(parents=True, exist_ok=True)
+    workspace_dirs = [layout.configs_dir, layout.addons_root, layout.scripts_dir, layout.backups_dir]
     if not no_data_dir:
-        layout.data_dir.mkdir(parents=True, exist_ok=True)
+        workspace_dirs.append(layout.data_dir)
+    _ensure_dirs(*workspace_dirs)
 
     # Sync repositories first, collect all requirements, then compile + install once.
     req_files: list[Path] = []
@@ -1921,6 +2244,7 @@ def sync_project(
                 depth=1,
                 single_branch=True,
                 fetch_all=False,
+                partial=cfg.odoo.partial,
             )
             checkout_commit(
                 layout.odoo_dir,
@@ -1938,8 +2262,10 @@ def sync_project(
                 depth=1,
                 single_branch=True,
                 fetch_all=False,
+                partial=cfg.odoo.partial,
             )
-            checkout_branch(layout.odoo_dir, cfg.odoo.branch, fetch_all=False, depth=1)
+            checkout_branch(layout.odoo_dir, cfg.odoo.branch, fetch_all=False, depth=1,
+                            partial=cfg.odoo.partial)
         else:
             # Full clone/fetch.
             ensure_repo(
@@ -1949,8 +2275,10 @@ def sync_project(
                 depth=None,
                 single_branch=False,
                 fetch_all=True,
+                partial=cfg.odoo.partial,
             )
-            checkout_branch(layout.odoo_dir, cfg.odoo.branch, fetch_all=True, depth=None)
+            checkout_branch(layout.odoo_dir, cfg.odoo.branch, fetch_all=True, depth=None,
+                            partial=cfg.odoo.partial)
 
         odoo_req = layout.odoo_dir / "requirements.txt"
         if not odoo_req.exists():
@@ -1966,7 +2294,8 @@ def sync_project(
     if sync_addons:
         if not cfg.addons:
             _logger.info("No [addons.*] sections configured; skipping addons sync.")
-        for addon_name, spec in cfg.addons.items():
+
+        def _sync_one_addon(addon_name: str, spec: AddonSpec) -> Optional[Path]:
             dest = _validate_local_addon_path(layout, addon_name, spec)
 
             if spec.is_local:
@@ -1989,6 +2318,7 @@ def sync_project(
                     depth=1,
                     single_branch=True,
                     fetch_all=False,
+                    partial=spec.partial,
                 )
                 checkout_commit(
                     dest,
@@ -2006,8 +2336,10 @@ def sync_project(
                     depth=1,
                     single_branch=True,
                     fetch_all=False,
+                    partial=spec.partial,
                 )
-                checkout_branch(dest, spec.branch, fetch_all=False, depth=1)
+                checkout_branch(dest, spec.branch, fetch_all=False, depth=1,
+                                partial=spec.partial)
             else:
                 # Full clone/fetch.
                 ensure_repo(
@@ -2017,12 +2349,26 @@ def sync_project(
                     depth=None,
                     single_branch=False,
                     fetch_all=True,
+                    partial=spec.partial,
                 )
-                checkout_branch(dest, spec.branch, fetch_all=True, depth=None)
+                checkout_branch(dest, spec.branch, fetch_all=True, depth=None,
+                                partial=spec.partial)
 
             addon_req = dest / "requirements.txt"
-            if addon_req.exists():
-                req_files.append(addon_req)
+            return addon_req if addon_req.exists() else None
+
+        # Each addon sync is an independent network-bound git pipeline, so run
+        # them concurrently; wall time approaches the slowest repo instead of
+        # the sum. Results are collected in submission (INI) order, which keeps
+        # req_files deterministic and re-raises the first failure.
+        addon_items = list(cfg.addons.items())
+        if len(addon_items) <= 1:
+            addon_reqs = [_sync_one_addon(name, spec) for name, spec in addon_items]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(addon_items))) as ex:
+                futures = [ex.submit(_sync_one_addon, name, spec) for name, spec in addon_items]
+                addon_reqs = [future.result() for future in futures]
+        req_files.extend(req for req in addon_reqs if req is not None)
     else:
         # If we're provisioning python but not syncing repos, use existing addon requirements (if present).
         if venv_py is not None and cfg.addons:
@@ -2036,7 +2382,7 @@ def sync_project(
     # In --create-venv-from-wheelhouse mode we skip compilation + wheel build and only install offline from existing lock/wheels.
     if venv_py is not None:
         # The generated scripts assume ROOT/odoo exists.
-        if not layout.odoo_dir.exists() or not layout.odoo_dir.is_dir():
+        if not layout.odoo_dir.is_dir():
             raise Exception(
                 f"Odoo directory not found: {layout.odoo_dir}. "
                 "Run with --sync-odoo/--sync-all first (or ensure ROOT/odoo exists)."
@@ -2047,9 +2393,10 @@ def sync_project(
 
         if reuse_wheelhouse:
             # Reuse existing wheelhouse (offline-only mode)
-            if not layout.wheelhouse_dir.exists() or not layout.wheelhouse_dir.is_dir():
+            has_wheels = _dir_has_suffix(layout.wheelhouse_dir, ".whl")
+            if has_wheels is None:
                 raise Exception(f"Wheelhouse directory not found: {layout.wheelhouse_dir}")
-            if not any(layout.wheelhouse_dir.glob("*.whl")):
+            if not has_wheels:
                 raise Exception(f"Wheelhouse looks empty (no .whl files): {layout.wheelhouse_dir}")
 
             if not lock_path.exists():
@@ -2071,11 +2418,6 @@ def sync_project(
                 requirements_path=lock_path,
             )
         else:
-            # Write build constraints to file
-            if cfg.virtualenv.build_constraints:
-                build_constraints_path.write_text(
-                    "\n".join(cfg.virtualenv.build_constraints).rstrip("\n") + "\n", encoding="utf-8")
-
             # We need Odoo requirements to produce a correct lock.
             odoo_req = layout.odoo_dir / "requirements.txt"
             if not odoo_req.exists():
@@ -2085,25 +2427,81 @@ def sync_project(
             if cfg.virtualenv.requirements:
                 base_requirements.extend(cfg.virtualenv.requirements)
 
-            compile_all_requirements_lock(
-                venv_python=venv_py,
-                workspace_root=layout.root,
-                wheelhouse_dir=layout.wheelhouse_dir,
-                requirement_files=req_files,
-                base_requirements=base_requirements,
-                requirements_ignore=cfg.virtualenv.requirements_ignore,
-                output_lock_path=lock_path,
-                build_constraints_path=build_constraints_path,
+            # Drop duplicate requirement files (the same file can be collected
+            # by more than one branch above); first-seen order is kept so the
+            # lock input stays deterministic across runs.
+            req_files = list(dict.fromkeys(p.resolve() for p in req_files))
+
+            # Content-addressed short circuit: when nothing that feeds the
+            # lock/wheelhouse changed since the last successful build, reuse
+            # the existing wheelhouse instead of recompiling and rebuilding.
+            repo_dirs = [layout.odoo_dir] + [
+                _resolve_addon_path(layout, addon_name, spec)
+                for addon_name, spec in cfg.addons.items()
+                if not spec.is_local
+            ]
+            fingerprint = _pipeline_fingerprint(
+                ini_path,
+                req_files,
+                repo_dirs,
+                (
+                    cfg.virtualenv.python_version,
+                    tuple(base_requirements),
+                    tuple(cfg.virtualenv.requirements_ignore or []),
+                    tuple(cfg.virtualenv.build_constraints or []),
+                ),
             )
+            fingerprint_path = layout.wheelhouse_dir / ".fingerprint"
+            try:
+                cached_fingerprint = fingerprint_path.read_text(encoding="utf-8").strip()
+            except OSError:
+                cached_fingerprint = None
+
+            if (
+                cached_fingerprint == fingerprint
+                and not clear_pip_wheel_cache
+                and lock_path.exists()
+                and _dir_has_suffix(layout.wheelhouse_dir, ".whl")
+            ):
+                _logger.info(
+                    "Lock/wheelhouse inputs unchanged (fingerprint match); "
+                    "reusing existing wheelhouse: %s", layout.wheelhouse_dir
+                )
+            else:
+                # Stale (or first build): rebuild the wheelhouse from scratch.
+                _logger.info("Rebuilding wheelhouse: removing %s", layout.wheelhouse_dir)
+                _rmtree(layout.wheelhouse_dir)
+                layout.wheelhouse_dir.mkdir(parents=True, exist_ok=True)
 
-            build_wheelhouse_from_requirements(
-                venv_python=venv_py,
-                workspace_root=layout.root,
-                requirements_path=lock_path,
-                wheelhouse_dir=layout.wheelhouse_dir,
-                build_constraints_path=build_constraints_path,
-                clear_pip_wheel_cache=clear_pip_wheel_cache,
-            )
+                # Write build constraints to file
+                if cfg.virtualenv.build_constraints:
+                    _write_if_changed(
+                        build_constraints_path,
+                        "\n".join(cfg.virtualenv.build_constraints).rstrip("\n") + "\n",
+                    )
+
+                compile_all_requirements_lock(
+                    venv_python=venv_py,
+                    workspace_root=layout.root,
+                    wheelhouse_dir=layout.wheelhouse_dir,
+                    requirement_files=req_files,
+                    base_requirements=base_requirements,
+                    requirements_ignore=cfg.virtualenv.requirements_ignore,
+                    output_lock_path=lock_path,
+                    build_constraints_path=build_constraints_path,
+                )
+
+                build_wheelhouse_from_requirements(
+                    venv_python=venv_py,
+                    workspace_root=layout.root,
+                    requirements_path=lock_path,
+                    wheelhouse_dir=layout.wheelhouse_dir,
+                    build_constraints_path=build_constraints_path,
+                    clear_pip_wheel_cache=clear_pip_wheel_cache,
+                )
+
+                # Recorded only after a fully successful build.
+                fingerprint_path.write_text(fingerprint + "\n", encoding="utf-8")
 
             if create_venv:
                 pip_install_requirements_file(
@@ -2124,16 +2522,9 @@ def sync_project(
                 # Legacy editable install of odoo
                 "--config-settings", "editable_mode=compat",
             ]
-            p = subprocess.run(
-                cmd,
-                cwd=str(layout.root),
-                text=True,
-                capture_output=True,
-            )
-            _handle_process_output(p, err_msg=(
+            _run_streaming(cmd, cwd=layout.root, err_msg=(
                 "Failed to install Odoo in editable mode.\n"
-                f"Command: {' '.join(p.args if isinstance(p.args, list) else [str(p.args)])}\n"
-                f"{p.stdout}\n{p.stderr}"
+                f"Command: {' '.join(cmd)}"
             ))
 
     # Generate config (unless disabled).
@@ -2143,39 +2534,45 @@ def sync_project(
             for addon_name, spec in cfg.addons.items()
         ]
         conf_text = render_odoo_conf(cfg.config, layout, addon_paths)
-        layout.conf_path.write_text(conf_text, encoding="utf-8")
+        if not _write_if_changed(layout.conf_path, conf_text):
+            _logger.info("Config unchanged; not rewritten: %s", layout.conf_path)
     else:
         _logger.info("Skipping config generation (--no-configs).")
 
-    is_windows = sys.platform.startswith("win")
-
-    # Generate helper scripts (unless disabled).
+    # Generate helper scripts (unless disabled). Render everything first, then
+    # write the independent small files concurrently; the scripts directory
+    # was created above.
     if not no_scripts:
-        if is_windows:
-            write_run_bat(layout)
-            write_test_bat(layout)
-            write_shell_bat(layout)
-            write_update_bat(layout)
-        else:
-            write_run_sh(layout)
-            write_instance_sh(layout)
-            write_test_sh(layout)
-            write_shell_sh(layout)
-            write_update_sh(layout)
-
         db_name = cfg.config.get("db_name")
+        db: Optional[str] = None
         if not isinstance(db_name, str) or not db_name.strip():
             _logger.warning(
                 "Missing or invalid 'db_name' in [config] (expected non-empty string)."
                 "Database scripts (backup/restore/restore-force) will NOT be generated."
             )
         else:
-            if is_windows:
-                write_backup_bat(layout, db_name.strip())
-                write_restore_bat(layout, db_name.strip())
-            else:
-                write_backup_sh(layout, db_name.strip())
-                write_restore_sh(layout, db_name.strip())
+            db = db_name.strip()
+
+        scripts: list[tuple[Path, str, bool]] = []
+        if IS_WINDOWS:
+            for name, parts in _ODOO_SCRIPTS.items():
+                scripts.append((layout.script(name, "bat"), _emit_odoo_bat(*parts), False))
+            scripts.append((layout.script("update", "bat"), _emit_update_bat(), False))
+            if db is not None:
+                scripts.append((layout.script("backup", "bat"), _emit_backup_bat(db), False))
+                scripts.append((layout.script("restore", "bat"), _emit_restore_bat(db), False))
+        else:
+            for name, parts in _ODOO_SCRIPTS.items():
+                scripts.append((layout.script(name, "sh"), _emit_odoo_sh(*parts), True))
+            scripts.append((layout.script("instance", "sh"), _emit_instance_sh(), True))
+            scripts.append((layout.script("update", "sh"), _emit_update_sh(), True))
+            if db is not None:
+                scripts.append((layout.script("backup", "sh"), _emit_backup_sh(db), True))
+                scripts.append((layout.script("restore", "sh"), _emit_restore_sh(db), True))
+
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            for _ in ex.map(lambda entry: _write_script(*entry), scripts):
+                pass
     else:
         _logger.info("Skipping script generation (--no-scripts).")
 
@@ -2229,7 +2626,7 @@ def sync_project(
         print("  Scripts:            SKIPPED (--no-scripts)")
     else:
         print(f"  Scripts:")
-        if is_windows:
+        if IS_WINDOWS:
             print(f"  - run:              {layout.script("run", "bat")}")
             print(f"  - test:             {layout.script("test", "bat")}")
             print(f"  - shell:            {layout.script("shell", "bat")}")
@@ -2362,14 +2759,9 @@ def _validate_root_override(parser: argparse.ArgumentParser, raw_root: str) -> P
     """
     _logger.info('CLI --root provided: %s', raw_root)
 
-    candidate = Path(raw_root).expanduser()
-
-    # Resolve to an absolute path for consistent workspace layout and logging.
-    try:
-        resolved = candidate.resolve()
-    except Exception:
-        # Fallback: make it absolute without resolving symlinks.
-        resolved = candidate.absolute()
+    # Absolutize with pure string ops; symlink resolution (an lstat per path
+    # component) is not needed for a consistent workspace layout.
+    resolved = Path(os.path.abspath(os.path.expanduser(raw_root)))
 
     if not resolved.exists():
         parser.error(f'--root path does not exist: {resolved}')
@@ -2411,7 +2803,7 @@ def main() -> None:
     if vars_overrides:
         _logger.info('CLI [vars] overrides enabled for keys: %s', ', '.join(sorted(vars_overrides)))
 
-    ini_path = Path(args.ini).expanduser().resolve()
+    ini_path = Path(os.path.abspath(os.path.expanduser(args.ini)))
     if not ini_path.exists():
         parser.error(f'INI file does not exist: {ini_path}')
     if not ini_path.is_file():
@@ -2421,7 +2813,7 @@ def main() -> None:
     if args.root:
         root_override = _validate_root_override(parser, args.root)
     else:
-        _logger.info('Workspace ROOT default (INI directory): %s', ini_path.parent.resolve())
+        _logger.info('Workspace ROOT default (INI directory): %s', ini_path.parent)
 
     if args.all:
         sync_odoo, sync_addons = True, True
@@ -2433,8 +2825,6 @@ def main() -> None:
         # No sync target selected -> only regenerate configs + helper scripts.
         sync_odoo, sync_addons = False, False
 
-    ini_path = Path(args.ini).resolve()
-
     try:
         sync_project(
             ini_path,